@@ -6,103 +6,152 @@ Shared pattern library for Claude Code safety hooks.
 Contains common patterns for detecting sensitive files and environment variables.
 """
 
+import functools
 import re
-from typing import List, Pattern
 
-# Safe environment file patterns (templates/examples without real secrets)
+# Safe environment file suffixes (templates/examples without real secrets)
 # These should be checked BEFORE sensitive patterns to allow safe template files
-SAFE_ENV_FILE_PATTERNS: List[str] = [
-    r'\.env\.example$',
-    r'\.env\.template$',
-    r'\.env\.sample$',
-    r'\.env\.local\.example$',
-    r'\.env\.dist$',
-    r'env\.example$',
-    r'env\.template$',
-    r'env\.sample$',
-]
+SAFE_ENV_FILE_SUFFIXES: tuple[str, ...] = (
+    '.env.example',
+    '.env.template',
+    '.env.sample',
+    '.env.local.example',
+    '.env.dist',
+    'env.example',
+    'env.template',
+    'env.sample',
+)
 
-# Sensitive file patterns
-# These patterns match files that commonly contain credentials, keys, or secrets
-SENSITIVE_FILE_PATTERNS: List[str] = [
+# Sensitive file suffixes (matched against the lowercased path with endswith)
+# Fixed-suffix entries are kept out of the regex so the common case never
+# enters the regex engine
+SENSITIVE_FILE_SUFFIXES: tuple[str, ...] = (
     # Environment files
-    r'\.env(\.|$)',
-    r'\.env\..*',
-
-    # Credential files
-    r'credentials\.json',
-    r'credentials\.ya?ml',
-    r'secrets\.',
-    r'secret\.',
+    '.env',
 
     # Private keys and certificates
-    r'\.(pem|key|p12|pfx|crt|cer|der)$',
-    r'.*\.key$',
-    r'.*_key$',
-    r'.*-key$',
+    '.pem',
+    '.key',
+    '.p12',
+    '.pfx',
+    '.crt',
+    '.cer',
+    '.der',
+    '_key',
+    '-key',
+
+    # Docker and Kubernetes secrets
+    'docker/config.json',
+    '.kube/config',
+)
+
+# Sensitive file substrings (matched anywhere in the lowercased path)
+SENSITIVE_FILE_SUBSTRINGS: tuple[str, ...] = (
+    # Environment files
+    '.env.',
+
+    # Credential files
+    'credentials.json',
+    'credentials.yml',
+    'credentials.yaml',
+    'secrets.',
+    'secret.',
 
     # SSH keys
-    r'id_(rsa|ed25519|ecdsa)',
-    r'\.ssh/.*_key$',
-    r'\.ssh/id_',
+    'id_rsa',
+    'id_ed25519',
+    'id_ecdsa',
+    '.ssh/id_',
 
     # Cloud provider credentials
-    r'\.aws/credentials',
-    r'\.aws/config',
-    r'\.azure/credentials',
-    r'\.gcp/.*\.json$',
-    r'gcloud.*\.json$',
+    '.aws/credentials',
+    '.aws/config',
+    '.azure/credentials',
 
     # Docker and Kubernetes secrets
-    r'docker/config\.json$',
-    r'\.docker/config\.json$',
-    r'\.kube/config$',
-    r'kubeconfig',
+    'kubeconfig',
 
     # Database credentials
-    r'\.pgpass',
-    r'\.my\.cnf',
-    r'\.mongodb/.*',
+    '.pgpass',
+    '.my.cnf',
+    '.mongodb/',
 
     # API tokens and keys
-    r'\.npmrc',
-    r'\.pypirc',
-    r'\.gem/credentials',
+    '.npmrc',
+    '.pypirc',
+    '.gem/credentials',
 
     # Shell configuration (may contain credentials)
-    r'\.bashrc',
-    r'\.zshrc',
-    r'\.profile',
-    r'\.bash_profile',
+    '.bashrc',
+    '.zshrc',
+    '.profile',
+    '.bash_profile',
 
     # Git credentials
-    r'\.git-credentials',
-    r'\.netrc',
-]
+    '.git-credentials',
+    '.netrc',
+)
 
-# Sensitive environment variable patterns
-# These patterns match environment variable names that commonly contain secrets
-SENSITIVE_ENV_PATTERNS: List[str] = [
-    r'.*KEY.*',
-    r'.*SECRET.*',
-    r'.*TOKEN.*',
-    r'.*PASSWORD.*',
-    r'.*PASS.*',
-    r'.*PWD.*',
-    r'.*API.*',
-    r'.*AUTH.*',
-    r'.*CREDENTIAL.*',
-    r'.*PRIVATE.*',
-    r'.*CERT.*',
-    r'.*SALT.*',
-    r'.*HASH.*',
-    r'.*SIGNATURE.*',
-    r'.*SIGNING.*',
+# Sensitive file patterns
+# Remaining patterns that cannot be expressed as a plain suffix or substring
+SENSITIVE_FILE_PATTERNS: list[str] = [
+    # Cloud provider credentials (.gcp/ or gcloud anywhere before a .json suffix)
+    r'(?:\.gcp/|gcloud).*\.json$',
 ]
 
+# Literal needles, one of which is contained in every sensitive suffix,
+# substring, and pattern above. Text containing none of them (after
+# lowercasing and dropping shell quoting) cannot name a sensitive file.
+SENSITIVE_FILE_NEEDLES: tuple[str, ...] = (
+    '.env',
+    'credential',
+    'secret',
+    'key',
+    '.pem',
+    '.p12',
+    '.pfx',
+    '.crt',
+    '.cer',
+    '.der',
+    'id_',
+    'config',
+    '.pgpass',
+    '.my.cnf',
+    '.mongodb/',
+    '.npmrc',
+    '.pypirc',
+    '.bashrc',
+    '.zshrc',
+    'profile',
+    '.netrc',
+    '.gcp/',
+    'gcloud',
+)
+
+# Sensitive environment variable keywords
+# Environment variable names containing any of these (uppercase) substrings
+# commonly hold secrets
+SENSITIVE_ENV_KEYWORDS: tuple[str, ...] = (
+    'KEY',
+    'SECRET',
+    'TOKEN',
+    'PASSWORD',
+    'PASS',
+    'PWD',
+    'API',
+    'AUTH',
+    'CREDENTIAL',
+    'PRIVATE',
+    'CERT',
+    'SALT',
+    'HASH',
+    'SIGNATURE',
+    'SIGNING',
+)
+
 # Safe environment variables (allow-list)
-# These are common non-sensitive environment variables
-SAFE_ENV_VARS: List[str] = [
+# These are common non-sensitive environment variables, matched by exact name
+SAFE_ENV_VARS: list[str] = [
     'HOME',
     'USER',
     'PATH',
@@ -110,7 +159,6 @@ SAFE_ENV_VARS: List[str] = [
     'SHELL',
     'TERM',
     'LANG',
-    'LC_.*',
     'TZ',
     'EDITOR',
     'VISUAL',
@@ -125,20 +173,70 @@ SAFE_ENV_VARS: List[str] = [
     'HOSTNAME',
 ]
 
-def compile_patterns(patterns: List[str]) -> List[Pattern]:
+# Safe environment variable patterns (matched against the whole name)
+SAFE_ENV_VAR_PATTERNS: list[str] = [
+    r'LC_.*',
+]
+
+def compile_patterns(patterns: list[str], flags: int = 0) -> list[re.Pattern]:
     """Compile a list of regex pattern strings into Pattern objects."""
-    return [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+    return [re.compile(pattern, flags) for pattern in patterns]
 
-def matches_any_pattern(text: str, patterns: List[Pattern]) -> bool:
+def compile_union(patterns: list[str], flags: int = 0) -> re.Pattern:
+    """
+    Compile a list of regex pattern strings into a single alternation.
+
+    One search over the union replaces a Python-level loop over every
+    pattern, so a check costs a single scan of the text.
+    """
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), flags)
+
+# Every hook process starts a fresh interpreter, so regex compilation is paid
+# per tool call. Each union is compiled on first use and cached, so a hook
+# only pays for the checks it actually runs (and nothing when it exits early).
+# Patterns are case-sensitive: file patterns are lowercase and matched
+# against the lowercased path, the env var pattern is uppercase and matched
+# against the uppercased name, so the regex engine never case-folds
+@functools.cache
+def _sensitive_file_re() -> re.Pattern:
+    return compile_union(SENSITIVE_FILE_PATTERNS)
+
+@functools.cache
+def _safe_env_var_re() -> re.Pattern:
+    return compile_union(SAFE_ENV_VAR_PATTERNS)
+
+_SAFE_ENV_VAR_NAMES: frozenset[str] = frozenset(SAFE_ENV_VARS)
+_SHELL_QUOTING = str.maketrans('', '', '\'"\\')
+
+def matches_any_pattern(text: str, patterns: list[re.Pattern]) -> bool:
     """Check if text matches any of the compiled patterns."""
     return any(pattern.search(text) for pattern in patterns)
 
+def may_reference_sensitive_file(text: str) -> bool:
+    """
+    Cheap prefilter for text that may reference a sensitive file.
+
+    Quotes and backslashes are removed before the needle scan, since shell
+    parsing drops them (e.g. .e'n'v is the token .env).
+
+    Args:
+        text: Command or path to check
+
+    Returns:
+        False if text cannot contain a sensitive filename, True if a full
+        check is needed
+    """
+    text = text.lower().translate(_SHELL_QUOTING)
+    return any(needle in text for needle in SENSITIVE_FILE_NEEDLES)
+
+@functools.lru_cache(maxsize=512)
 def is_sensitive_file(file_path: str) -> bool:
     """
     Check if a file path matches any sensitive file pattern.
 
     Safe template files (e.g., .env.example) are checked first and allowed.
     Only files matching sensitive patterns without matching safe patterns are blocked.
+    Results are cached, since bash commands often repeat the same tokens.
 
     Args:
         file_path: Path to check
@@ -147,15 +245,22 @@ def is_sensitive_file(file_path: str) -> bool:
         True if the path matches a sensitive pattern and is NOT a safe template,
         False otherwise
     """
-    # Check safe patterns first - if it matches, allow it
-    safe_patterns = compile_patterns(SAFE_ENV_FILE_PATTERNS)
-    if matches_any_pattern(file_path, safe_patterns):
+    path_lower = file_path.lower()
+    # Suffixes are tested the way regex '$' matched: also before a trailing newline
+    path_end = path_lower.removesuffix('\n')
+
+    # Check safe suffixes first - if it matches, allow it
+    if path_end.endswith(SAFE_ENV_FILE_SUFFIXES):
         return False
 
-    # Now check if it matches sensitive patterns
-    compiled_patterns = compile_patterns(SENSITIVE_FILE_PATTERNS)
-    return matches_any_pattern(file_path, compiled_patterns)
+    # Now check if it matches sensitive suffixes, substrings, or patterns
+    if path_end.endswith(SENSITIVE_FILE_SUFFIXES):
+        return True
+    if any(substring in path_lower for substring in SENSITIVE_FILE_SUBSTRINGS):
+        return True
+    return bool(_sensitive_file_re().search(path_lower))
 
+@functools.lru_cache(maxsize=512)
 def is_sensitive_env_var(var_name: str) -> bool:
     """
     Check if an environment variable name is potentially sensitive.
@@ -167,11 +272,12 @@ def is_sensitive_env_var(var_name: str) -> bool:
         True if the variable name matches a sensitive pattern and is not
         in the safe variables allow-list, False otherwise
     """
-    # Check if it's in the safe list first
-    safe_patterns = compile_patterns(SAFE_ENV_VARS)
-    if matches_any_pattern(var_name, safe_patterns):
+    name_upper = var_name.upper()
+
+    # Check if it's in the safe list first (whole-name match, so HOME does
+    # not also allow-list HOMEBREW_API_TOKEN)
+    if name_upper in _SAFE_ENV_VAR_NAMES or _safe_env_var_re().fullmatch(name_upper):
         return False
 
-    # Check if it matches a sensitive pattern
-    sensitive_patterns = compile_patterns(SENSITIVE_ENV_PATTERNS)
-    return matches_any_pattern(var_name, sensitive_patterns)
+    # Check if it contains a sensitive keyword
+    return any(keyword in name_upper for keyword in SENSITIVE_ENV_KEYWORDS)
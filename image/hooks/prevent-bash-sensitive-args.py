@@ -1,4 +1,4 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -I -S
 """
 prevent-bash-sensitive-args.py
 
@@ -11,9 +11,9 @@ This prevents bypassing file access controls via indirect operations like:
 - cat id_rsa (read via bash instead of Read tool)
 - rm secrets.txt (delete sensitive files)
 
-The hook parses command syntax using shlex to extract tokens, then checks
+The hook parses command syntax the way shlex does to extract tokens, then checks
 each token against sensitive filename patterns. It also handles command
-substitution by recursively checking content inside $(...) and backticks.
+substitution by checking content inside $(...) and backticks.
 
 Exit codes:
     0 - Command is allowed
@@ -22,6 +22,7 @@ Exit codes:
 
 import json
 import os
+import re
 import shlex
 import sys
 
@@ -30,7 +31,24 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 LIB_DIR = os.path.join(SCRIPT_DIR, 'lib')
 sys.path.insert(0, LIB_DIR)
 
-from patterns import is_sensitive_file
+from patterns import is_sensitive_file, may_reference_sensitive_file
+
+# One piece of a shell word, matched at the current scan position. Together
+# these reproduce shlex.split(posix=True): whitespace separates words, a
+# backslash escapes any character outside quotes, single quotes are literal,
+# and inside double quotes a backslash only escapes a quote or backslash.
+_WORD_PIECE_RE = re.compile(r'''
+    (?P<space>[ \t\r\n]+)
+    | (?P<plain>[^ \t\r\n'"\\]+)
+    | \\(?P<escaped>[\s\S])
+    | '(?P<single>[^']*)'
+    | "(?P<double>(?:[^"\\]|\\[\s\S])*)"
+''', re.VERBOSE)
+_DOUBLE_QUOTE_ESCAPE_RE = re.compile(r'\\(["\\])')
+
+# Non-nested $(...) and backtick substitutions. An unclosed $( swallows the
+# rest of the token without producing a result, as the full scanner does.
+_SUBSTITUTION_RE = re.compile(r'\$\(([^)]*)\)|\$\([^)]*\Z|`([^`]*)`')
 
 
 def extract_command_substitutions(token: str) -> list[str]:
@@ -47,6 +65,15 @@ def extract_command_substitutions(token: str) -> list[str]:
     Returns:
         List of inner command strings extracted from substitution constructs
     """
+    if token.count('$(') <= 1:
+        # Without nesting the first ')' closes the substitution, so the
+        # regex finds exactly what the depth-counting scan below would
+        return [
+            match.group(match.lastindex)
+            for match in _SUBSTITUTION_RE.finditer(token)
+            if match.lastindex
+        ]
+
     results = []
     i = 0
     while i < len(token):
@@ -85,28 +112,58 @@ def extract_command_substitutions(token: str) -> list[str]:
 
 def parse_command_tokens(command: str) -> list[str]:
     """
-    Parse command into tokens using shlex.
+    Parse command into tokens, matching shlex.split(command, posix=True).
+
+    Scans whole runs of characters with a compiled regex rather than
+    stepping through shlex's per-character state machine. Malformed input
+    is handed to shlex so the error message is the same.
 
     Raises:
         ValueError: If command is malformed (unclosed quotes, etc.)
     """
-    return shlex.split(command, posix=True)
-
-
-def contains_sensitive_filename(command: str, _depth: int = 0) -> tuple[bool, str]:
+    tokens = []
+    word = None
+    pos = 0
+    end = len(command)
+    match_piece = _WORD_PIECE_RE.match
+
+    while pos < end:
+        match = match_piece(command, pos)
+        if match is None:
+            # Unclosed quote or trailing backslash
+            return shlex.split(command, posix=True)
+        pos = match.end()
+
+        kind = match.lastgroup
+        if kind == 'space':
+            if word is not None:
+                tokens.append(word)
+                word = None
+            continue
+
+        piece = match.group(kind)
+        if kind == 'double':
+            piece = _DOUBLE_QUOTE_ESCAPE_RE.sub(r'\1', piece)
+        word = piece if word is None else word + piece
+
+    if word is not None:
+        tokens.append(word)
+    return tokens
+
+
+def contains_sensitive_filename(command: str) -> tuple[bool, str]:
     """
     Check if command contains any sensitive filename pattern.
 
-    Uses shlex to properly tokenize the command, handling quoted strings
-    and escapes. Each token is checked against sensitive file patterns,
+    Tokenizes the command with shell (shlex) quoting rules, handling quoted
+    strings and escapes. Each token is checked against sensitive file patterns,
     with safe patterns (like .env.example) allowed through.
 
-    Command substitutions $(...) and backticks are recursively parsed
-    and checked.
+    Command substitutions $(...) and backticks are queued and checked the
+    same way, up to 10 levels deep.
 
     Args:
         command: The shell command to check
-        _depth: Internal recursion depth counter (max 10)
 
     Returns:
         Tuple of (is_sensitive, matched_token)
@@ -116,23 +173,24 @@ def contains_sensitive_filename(command: str, _depth: int = 0) -> tuple[bool, st
     Raises:
         ValueError: If command syntax is malformed
     """
-    # Prevent infinite recursion - fail closed for security
-    if _depth > 10:
-        return True, "recursion depth exceeded"
-
-    for token in parse_command_tokens(command):
-        # Check for command substitutions - recursively check inner content
-        inner_commands = extract_command_substitutions(token)
-        if inner_commands:
-            for inner_cmd in inner_commands:
-                is_sensitive, match = contains_sensitive_filename(inner_cmd, _depth + 1)
-                if is_sensitive:
-                    return True, f"{match} (in substitution)"
-
-        # Always check the token itself (even if it contains substitutions)
-        # This catches cases like "$(echo foo).env" where .env is in outer token
-        if is_sensitive_file(token):
-            return True, token
+    # (command, substitution depth) still to be checked
+    pending = [(command, 0)]
+
+    while pending:
+        current, depth = pending.pop()
+
+        # Prevent unbounded nesting - fail closed for security
+        if depth > 10:
+            return True, "recursion depth exceeded"
+
+        for token in parse_command_tokens(current):
+            # Check the token itself (even if it contains substitutions)
+            # This catches cases like "$(echo foo).env" where .env is in outer token
+            if is_sensitive_file(token):
+                return True, token + " (in substitution)" * depth
+
+            for inner_cmd in extract_command_substitutions(token):
+                pending.append((inner_cmd, depth + 1))
 
     return False, ""
 
@@ -140,8 +198,8 @@ def contains_sensitive_filename(command: str, _depth: int = 0) -> tuple[bool, st
 def main():
     try:
         # Read JSON input from stdin
-        input_data = json.load(sys.stdin)
-    except json.JSONDecodeError as e:
+        input_data = json.loads(sys.stdin.buffer.read())
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         print(f"Error: Invalid JSON input: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -156,6 +214,10 @@ def main():
     if not command:
         sys.exit(0)
 
+    # Most commands mention nothing that could be a sensitive filename
+    if not may_reference_sensitive_file(command):
+        sys.exit(0)
+
     # Check if command contains sensitive filename patterns
     try:
         is_sensitive, matched_pattern = contains_sensitive_filename(command)
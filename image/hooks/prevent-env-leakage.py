@@ -1,4 +1,4 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -I -S
 """
 prevent-env-leakage.py
 
@@ -60,31 +60,26 @@ ASSIGNMENT_PATTERNS = [
     r'\bexport\s+[A-Z_][A-Z0-9_]*=',  # export VAR=value
 ]
 
-def extract_referenced_vars(command: str) -> set:
-    """
-    Extract all environment variable names referenced in a command.
-
-    Args:
-        command: The bash command to analyze
-
-    Returns:
-        Set of environment variable names found in the command
-    """
-    vars_found = set()
-
-    # Check for direct variable references: $VAR or ${VAR}
-    var_pattern = re.compile(r'\$\{?([A-Z_][A-Z0-9_]*)\}?')
-    for match in var_pattern.finditer(command):
-        var_name = match.group(1)
-        vars_found.add(var_name)
-
-    # Check for printenv VAR
-    printenv_pattern = re.compile(r'\bprintenv\s+([A-Z_][A-Z0-9_]*)')
-    for match in printenv_pattern.finditer(command):
-        var_name = match.group(1)
-        vars_found.add(var_name)
-
-    return vars_found
+# Every access pattern above contains one of these literals
+_ENV_ACCESS_NEEDLES = ('$', 'env', 'export')
+
+# Compiled once at import instead of on every check
+_ASSIGNMENT_RES = [re.compile(pattern) for pattern in ASSIGNMENT_PATTERNS]
+
+# Single scan over the command: each match is either a command that dumps
+# every environment variable or a reference to one variable
+_ENV_SCAN_RE = re.compile(r"""
+    (?P<all_env>
+        \benv\s*(?:$|\|)              # bare 'env' (not in assignment)
+        | \bprintenv\s*(?:$|\||>)     # bare 'printenv' (without arguments)
+        | \bexport\s+-p\b             # export -p
+        | /proc/(?:self|\d+)/environ  # /proc/*/environ access
+        | \$\(\s*env\s*\)             # $(env)
+        | `\s*env\s*`                 # `env`
+    )
+    | \$\{?(?P<var>[A-Z_][A-Z0-9_]*)\}?                  # $VAR or ${VAR}
+    | \bprintenv\s+(?P<printenv_var>[A-Z_][A-Z0-9_]*)    # printenv VAR
+""", re.VERBOSE)
 
 def is_assignment_only(command: str) -> bool:
     """
@@ -96,51 +91,40 @@ def is_assignment_only(command: str) -> bool:
     Returns:
         True if command only assigns variables, False otherwise
     """
-    for pattern in ASSIGNMENT_PATTERNS:
-        if re.match(pattern, command.strip()):
-            return True
-    return False
+    stripped = command.strip()
+    return any(pattern.match(stripped) for pattern in _ASSIGNMENT_RES)
 
-def accesses_all_env_vars(command: str) -> bool:
+def scan_env_access(command: str) -> tuple[bool, set]:
     """
-    Check if command attempts to access all environment variables.
+    Find environment variable access in a command with a single regex pass.
 
     Commands like 'env', 'export -p', 'printenv', reading /proc/self/environ
-    dump all environment variables, which would expose all secrets.
+    dump all environment variables, which would expose all secrets. Direct
+    references ($VAR, ${VAR}, printenv VAR) are collected by name.
 
     Args:
-        command: The bash command to check
+        command: The bash command to analyze
 
     Returns:
-        True if command accesses all env vars, False otherwise
+        Tuple of (accesses_all, referenced_vars)
+        - accesses_all: True if command accesses all env vars
+        - referenced_vars: Set of environment variable names found before
+          the scan stopped (it stops at the first dump-all match)
     """
-    # Check for bare 'env' command (not in assignment)
-    if re.search(r'\benv\s*($|\|)', command):
-        return True
-
-    # Check for bare 'printenv' command (without arguments)
-    if re.search(r'\bprintenv\s*($|\||>)', command):
-        return True
-
-    # Check for export -p
-    if re.search(r'\bexport\s+-p\b', command):
-        return True
-
-    # Check for /proc/*/environ access
-    if re.search(r'/proc/(self|\d+)/environ', command):
-        return True
+    vars_found = set()
 
-    # Check for command substitution with env
-    if re.search(r'\$\(\s*env\s*\)', command) or re.search(r'`\s*env\s*`', command):
-        return True
+    for match in _ENV_SCAN_RE.finditer(command):
+        if match.group('all_env') is not None:
+            return True, vars_found
+        vars_found.add(match.group('var') or match.group('printenv_var'))
 
-    return False
+    return False, vars_found
 
 def main():
     try:
         # Read JSON input from stdin
-        input_data = json.load(sys.stdin)
-    except json.JSONDecodeError as e:
+        input_data = json.loads(sys.stdin.buffer.read())
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         print(f"Error: Invalid JSON input: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -155,12 +139,18 @@ def main():
     if not command:
         sys.exit(0)
 
+    # Skip the regex checks for commands that cannot touch the environment
+    if not any(needle in command for needle in _ENV_ACCESS_NEEDLES):
+        sys.exit(0)
+
     # Allow pure assignments (setting vars, not reading)
     if is_assignment_only(command):
         sys.exit(0)
 
+    accesses_all, referenced_vars = scan_env_access(command)
+
     # Block commands that access all environment variables
-    if accesses_all_env_vars(command):
+    if accesses_all:
         print("""🚫 Command blocked: attempts to access all environment variables.
 
 Commands that dump all environment variables are blocked to prevent credential leakage.
@@ -204,9 +194,7 @@ If you need to inspect environment for debugging:
 """, file=sys.stderr)
         sys.exit(2)
 
-    # Extract and check specific variable references
-    referenced_vars = extract_referenced_vars(command)
-
+    # Check specific variable references
     if referenced_vars:
         sensitive_vars = [var for var in referenced_vars if is_sensitive_env_var(var)]
 
@@ -14,21 +14,17 @@ Commands (environment-aware):
 """
 
 import argparse
-import atexit
 import json
 import os
-import re
-import signal
 import subprocess
 import sys
+import time
 from datetime import datetime, timezone
+from functools import cache
 from pathlib import Path
+from typing import Iterable
 
-from .executor import (
-    dispatch_to_instance,
-    run_epic_to_completion,
-    run_story_to_completion,
-)
+from .fileutil import atomic_write_bytes
 from .status import (
     Action,
     SprintStatus,
@@ -81,8 +77,9 @@ def confirm(message: str, default_yes: bool = False) -> bool:
 
 
 # Environment detection
+@cache
 def is_inside_devcontainer() -> bool:
-    """Check if running inside a devcontainer."""
+    """Check if running inside a devcontainer (evaluated once per process)."""
     return bool(os.environ.get("CLAUDE_INSTANCE"))
 
 
@@ -91,40 +88,73 @@ def get_instance_name() -> str | None:
     return os.environ.get("CLAUDE_INSTANCE")
 
 
-def get_running_instances() -> list[dict]:
+# How long an instance listing is reused by get_running_instances (seconds)
+INSTANCES_MAX_AGE = 2.0
+
+# Last instance listing and the time.monotonic() it was fetched at
+_instances_cache: tuple[float, list[dict]] | None = None
+
+
+def list_instances(max_age: float | None = None) -> list[dict]:
     """
-    Get list of running instances with their details.
+    Get every instance record reported by claude-instance list --json.
+
+    Listing spawns claude-instance, which in turn queries docker, so the
+    result is cached and shared by all lookups.
 
-    Returns list of dicts with: name, purpose, path.
-    Only works outside devcontainer.
+    Args:
+        max_age: Re-query if the cached listing is older than this many
+            seconds (None reuses it for the rest of the process)
+
+    Returns an empty list if claude-instance fails.
     """
+    global _instances_cache
+
+    now = time.monotonic()
+    if _instances_cache is not None and (max_age is None or now - _instances_cache[0] <= max_age):
+        return _instances_cache[1]
+
+    instances = []
     try:
         # Use absolute path based on this script's location
         scripts_dir = Path(__file__).parent.parent
         claude_instance = scripts_dir / "claude-instance"
 
+        # stdout stays bytes - json.loads decodes it directly
         result = subprocess.run(
             [str(claude_instance), "list", "--json"],
             capture_output=True,
-            text=True,
             timeout=10,
         )
-        if result.returncode != 0:
-            return []
+        if result.returncode == 0:
+            instances = json.loads(result.stdout).get("instances", [])
+    except (subprocess.TimeoutExpired, FileNotFoundError, ValueError):
+        pass
+
+    _instances_cache = (now, instances)
+    return instances
 
-        data = json.loads(result.stdout)
-        instances = []
-        for inst in data.get("instances", []):
-            if inst.get("running", False):
-                instances.append({
-                    "name": inst.get("name", ""),
-                    "purpose": inst.get("purpose", ""),
-                    "path": inst.get("path", ""),
-                })
 
-        return instances
-    except (subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError):
-        return []
+def get_running_instances() -> list[dict]:
+    """
+    Get list of running instances with their details.
+
+    Returns list of dicts with: name, purpose, path, container.
+    Only works outside devcontainer. A listing up to INSTANCES_MAX_AGE
+    seconds old is reused, so repeated calls within one menu render
+    don't re-run claude-instance.
+    """
+    instances = []
+    for inst in list_instances(max_age=INSTANCES_MAX_AGE):
+        if inst.get("running", False):
+            instances.append({
+                "name": inst.get("name", ""),
+                "purpose": inst.get("purpose", ""),
+                "path": inst.get("path", ""),
+                "container": inst.get("container", ""),
+            })
+
+    return instances
 
 
 # Dispatch tracking - stored in .claude/ which is already partially gitignored
@@ -132,57 +162,185 @@ DISPATCH_FILE = ".claude/.bmad-dispatched.json"
 
 
 def get_dispatch_file(project: Path) -> Path:
-    """Get path to dispatch tracking file."""
-    dispatch_file = project / DISPATCH_FILE
-    dispatch_file.parent.mkdir(parents=True, exist_ok=True)
-    return dispatch_file
+    """Get path to dispatch tracking file (its directory is created on write)."""
+    return project / DISPATCH_FILE
+
+
+# Parsed lock files keyed by path, with the (mtime_ns, size) they were read at
+_json_cache: dict[Path, tuple[tuple[int, int], dict]] = {}
+
+
+def _read_json_cached(path: Path) -> dict:
+    """
+    Read and parse a JSON state file, reusing the last parse if unchanged.
+
+    A menu render reads the same lock files several times;
+    a stat() is enough to tell whether the file changed since.
+    Returns a shallow copy so callers can modify it freely.
+
+    Raises OSError if the file can't be read, JSONDecodeError if invalid.
+    """
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _json_cache.get(path)
+    if cached is None or cached[0] != key:
+        cached = (key, json.loads(path.read_bytes()))
+        _json_cache[path] = cached
+    return dict(cached[1])
+
+
+def _dump_json(data: dict) -> bytes:
+    """
+    Serialize a JSON state file.
+
+    Output is compact: json.dumps only uses its C encoder when no indent
+    is given. The files are read by this CLI and by jq in the Stop hook.
+    """
+    return (json.dumps(data, separators=(",", ":")) + "\n").encode()
+
+
+class DispatchStore:
+    """
+    Dispatched work for one project, kept in memory.
+
+    The dispatch file is parsed again only when its (mtime_ns, size)
+    changes, so writes from other bmad processes are still picked up.
+    Every change is written back atomically right away and the written
+    state stays in memory, so reading it back costs only a stat().
+    """
+
+    def __init__(self, project: Path):
+        self.path = get_dispatch_file(project)
+        self._key: tuple[int, int] | None = None
+        self._dispatched: dict[str, dict] = {}
+        self._ids: frozenset[str] | None = None
+
+    def _refresh(self) -> None:
+        try:
+            st = self.path.stat()
+        except OSError:
+            if self._key is not None:
+                self._key = None
+                self._dispatched = {}
+                self._ids = None
+            return
+
+        key = (st.st_mtime_ns, st.st_size)
+        if key != self._key:
+            try:
+                self._dispatched = json.loads(self.path.read_bytes())
+            except (json.JSONDecodeError, OSError):
+                self._dispatched = {}
+            self._key = key
+            self._ids = None
+
+    def _write(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        st = atomic_write_bytes(self.path, _dump_json(self._dispatched))
+        self._key = (st.st_mtime_ns, st.st_size)
+        self._ids = None
+
+    @property
+    def dispatched(self) -> dict[str, dict]:
+        """Current dispatch records by story ID (do not modify)."""
+        self._refresh()
+        return self._dispatched
+
+    @property
+    def story_ids(self) -> frozenset[str]:
+        """IDs of dispatched stories, rebuilt only when the records change."""
+        self._refresh()
+        if self._ids is None:
+            self._ids = frozenset(self._dispatched)
+        return self._ids
+
+    def get(self, story_id: str) -> dict | None:
+        """Get the dispatch record for a story, or None."""
+        return self.dispatched.get(story_id)
+
+    def set(self, story_id: str, info: dict) -> None:
+        """Add or replace the dispatch record for a story."""
+        self._refresh()
+        self._dispatched[story_id] = info
+        self._write()
+
+    def pop(self, story_id: str) -> dict | None:
+        """Remove and return the dispatch record for a story, if any."""
+        self._refresh()
+        if story_id not in self._dispatched:
+            return None
+        info = self._dispatched.pop(story_id)
+        self._write()
+        return info
+
+    def pop_many(self, story_ids: Iterable[str]) -> int:
+        """Remove the records for several stories with one write; returns how many."""
+        self._refresh()
+        removed = 0
+        for story_id in story_ids:
+            if self._dispatched.pop(story_id, None) is not None:
+                removed += 1
+        if removed:
+            self._write()
+        return removed
+
+    def replace(self, dispatched: dict[str, dict]) -> None:
+        """Replace all dispatch records."""
+        self._dispatched = dict(dispatched)
+        self._write()
+
+
+_dispatch_stores: dict[Path, DispatchStore] = {}
+
+
+def get_dispatch_store(project: Path) -> DispatchStore:
+    """Get the dispatch store for a project, creating it on first use."""
+    store = _dispatch_stores.get(project)
+    if store is None:
+        store = _dispatch_stores[project] = DispatchStore(project)
+    return store
 
 
 def load_dispatched(project: Path) -> dict:
     """Load currently dispatched work."""
-    dispatch_file = get_dispatch_file(project)
-    if dispatch_file.exists():
-        try:
-            return json.loads(dispatch_file.read_text())
-        except json.JSONDecodeError:
-            return {}
-    return {}
+    return dict(get_dispatch_store(project).dispatched)
 
 
 def save_dispatched(project: Path, dispatched: dict) -> None:
     """Save dispatched work tracking."""
-    dispatch_file = get_dispatch_file(project)
-    dispatch_file.write_text(json.dumps(dispatched, indent=2) + "\n")
+    get_dispatch_store(project).replace(dispatched)
 
 
 def record_dispatch(
     project: Path, story_id: str, action: str, instance: str, instance_path: str
 ) -> None:
     """Record that work has been dispatched to an instance."""
-    dispatched = load_dispatched(project)
-    dispatched[story_id] = {
+    get_dispatch_store(project).set(story_id, {
         "action": action,
         "instance": instance,
         "instance_path": instance_path,
         "started": datetime.now(timezone.utc).isoformat(),
-    }
-    save_dispatched(project, dispatched)
+    })
 
 
-def clear_dispatch(project: Path, story_id: str) -> None:
-    """Clear dispatch record for a story (called when work completes)."""
-    dispatched = load_dispatched(project)
-    if story_id in dispatched:
-        del dispatched[story_id]
-        save_dispatched(project, dispatched)
+def clear_dispatch(project: Path, story_id: str) -> dict | None:
+    """
+    Clear dispatch record for a story (called when work completes).
+
+    Returns the removed record, or None if the story was not dispatched.
+    """
+    return get_dispatch_store(project).pop(story_id)
+
+
+def clear_dispatches(project: Path, story_ids: Iterable[str]) -> int:
+    """Clear dispatch records for several stories; returns how many were removed."""
+    return get_dispatch_store(project).pop_many(story_ids)
 
 
 def is_dispatched(project: Path, story_id: str) -> tuple[bool, dict | None]:
     """Check if a story is currently dispatched."""
-    dispatched = load_dispatched(project)
-    if story_id in dispatched:
-        return True, dispatched[story_id]
-    return False, None
+    info = get_dispatch_store(project).get(story_id)
+    return info is not None, info
 
 
 # Run lock management - tracks actively running commands
@@ -190,10 +348,8 @@ LOCK_DIR = ".claude/.bmad-running"
 
 
 def get_lock_dir(project: Path) -> Path:
-    """Get path to lock directory."""
-    lock_dir = project / LOCK_DIR
-    lock_dir.mkdir(parents=True, exist_ok=True)
-    return lock_dir
+    """Get path to lock directory (created by create_run_lock)."""
+    return project / LOCK_DIR
 
 
 def get_lock_file(project: Path, story_id: str) -> Path:
@@ -210,6 +366,7 @@ def create_run_lock(
     Returns path to lock file for cleanup.
     """
     lock_file = get_lock_file(project, story_id)
+    lock_file.parent.mkdir(parents=True, exist_ok=True)
     lock_data = {
         "story_id": story_id,
         "action": action,
@@ -218,7 +375,8 @@ def create_run_lock(
         "started": datetime.now(timezone.utc).isoformat(),
         "instance": get_instance_name() or "local",
     }
-    lock_file.write_text(json.dumps(lock_data, indent=2) + "\n")
+    atomic_write_bytes(lock_file, _dump_json(lock_data))
+    _json_cache.pop(lock_file, None)
     return lock_file
 
 
@@ -229,27 +387,27 @@ def update_lock_status(project: Path, story_id: str, starting_status: str) -> No
     Called at the start of each phase so the Stop hook can detect phase completion.
     """
     lock_file = get_lock_file(project, story_id)
-    if not lock_file.exists():
-        return
 
     try:
-        lock_data = json.loads(lock_file.read_text())
+        lock_data = json.loads(lock_file.read_bytes())
         lock_data["starting_status"] = starting_status
-        lock_file.write_text(json.dumps(lock_data, indent=2) + "\n")
+        atomic_write_bytes(lock_file, _dump_json(lock_data))
+        _json_cache.pop(lock_file, None)
     except (json.JSONDecodeError, OSError):
-        pass  # Lock file corrupted or inaccessible
+        pass  # Lock file missing, corrupted or inaccessible
 
 
 def remove_run_lock(project: Path, story_id: str) -> None:
     """Remove lock file for a story."""
     lock_file = get_lock_file(project, story_id)
-    if lock_file.exists():
-        lock_file.unlink()
+    lock_file.unlink(missing_ok=True)
+    _json_cache.pop(lock_file, None)
 
     # Clean up empty lock directory
-    lock_dir = get_lock_dir(project)
-    if lock_dir.exists() and not any(lock_dir.iterdir()):
-        lock_dir.rmdir()
+    try:
+        get_lock_dir(project).rmdir()
+    except OSError:
+        pass  # Other locks remain, or no lock directory
 
 
 def load_run_locks(project: Path) -> dict[str, dict]:
@@ -257,115 +415,187 @@ def load_run_locks(project: Path) -> dict[str, dict]:
     lock_dir = get_lock_dir(project)
     locks = {}
 
-    if not lock_dir.exists():
+    try:
+        # scandir yields names with their file type, no Path per entry
+        entries = os.scandir(lock_dir)
+    except FileNotFoundError:
         return locks
 
-    for lock_file in lock_dir.glob("*.json"):
-        try:
-            data = json.loads(lock_file.read_text())
-            story_id = lock_file.stem
-            locks[story_id] = data
-        except (json.JSONDecodeError, OSError):
-            continue
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            try:
+                data = _read_json_cached(Path(entry.path))
+                story_id = entry.name[:-len(".json")]
+                locks[story_id] = data
+            except (json.JSONDecodeError, OSError):
+                continue
 
     return locks
 
 
 def is_process_running(pid: int) -> bool:
-    """Check if a process with given PID is running locally."""
+    """
+    Check if a process with given PID is running locally.
+
+    On Linux this is a /proc lookup, which also sees processes owned by
+    other users and needs no signal permission check.
+    """
+    if sys.platform == "linux":
+        return os.path.exists(f"/proc/{pid}")
+
     try:
         os.kill(pid, 0)  # Signal 0 just checks if process exists
         return True
+    except PermissionError:
+        return True  # Exists, but owned by another user
     except (OSError, ProcessLookupError):
         return False
 
 
-def get_container_name_for_instance(instance_name: str) -> str | None:
+def get_container_name_for_instance(
+    instance_name: str, instances: list[dict] | None = None
+) -> str | None:
     """
     Find the docker container name for a given instance.
 
-    Uses claude-instance list --json to get accurate container info.
+    Searches instances if given (e.g. from get_running_instances), otherwise
+    uses claude-instance list --json to get accurate container info.
     Returns None if no matching container is found.
     """
-    import subprocess
+    if instances is None:
+        instances = list_instances()
 
-    try:
-        result = subprocess.run(
-            ["./scripts/claude-instance", "list", "--json"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode != 0:
-            return None
-
-        data = json.loads(result.stdout)
-        for instance in data.get("instances", []):
-            if instance.get("name") == instance_name:
-                container = instance.get("container", "")
-                return container if container else None
-        return None
-    except (subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError):
-        return None
+    for instance in instances:
+        if instance.get("name") == instance_name:
+            container = instance.get("container", "")
+            return container if container else None
+    return None
 
 
-def is_process_running_in_container(instance_name: str, pid: int) -> bool:
+def check_pids_in_container(container_name: str, pids: list[int]) -> dict[int, bool]:
     """
-    Check if a process with given PID is running inside a container.
+    Check which of the given PIDs are running inside a container.
 
-    Uses docker exec to check the process table inside the container.
-    Returns False if container doesn't exist or process isn't running.
+    All PIDs are checked by a single docker exec, so the docker client
+    startup is paid once per container rather than once per PID.
+    Every PID is reported as not running if the container can't be reached.
     """
-    import subprocess
-
-    container_name = get_container_name_for_instance(instance_name)
-    if not container_name:
-        return False
+    pids = [int(pid) for pid in pids]
+    script = "; ".join(f"kill -0 {pid} 2>/dev/null && echo {pid}" for pid in pids)
 
+    live: set[int] = set()
     try:
         result = subprocess.run(
-            ["docker", "exec", container_name, "kill", "-0", str(pid)],
+            ["docker", "exec", container_name, "sh", "-c", script],
             capture_output=True,
+            text=True,
             timeout=5,
         )
-        return result.returncode == 0
+        # Exit status is that of the last check, so only stdout matters
+        live = {int(line) for line in result.stdout.split() if line.isdigit()}
     except (subprocess.TimeoutExpired, FileNotFoundError):
-        return False
+        pass
+
+    return {pid: pid in live for pid in pids}
 
 
-def get_stale_dispatches(project: Path) -> list[dict]:
+def get_dispatch_pids(
+    project: Path,
+    dispatched: dict[str, dict],
+    locks_by_path: dict[str, dict[str, dict]] | None = None,
+) -> dict[str, tuple[str, int]]:
     """
-    Find dispatched work that is no longer running.
+    Find the run lock PID of each dispatched story.
 
-    Returns list of stale dispatch info dicts.
+    Lock files are loaded once per instance path. Pass locks_by_path to
+    reuse locks the caller already loaded (keyed by instance path, with
+    "" for the project itself); it is filled in with any new paths.
+
+    Returns (instance name, pid) by story ID, for stories with a lock file.
     """
-    dispatched = load_dispatched(project)
-    stale = []
+    if locks_by_path is None:
+        locks_by_path = {}
+    locked: dict[str, tuple[str, int]] = {}
 
     for story_id, info in dispatched.items():
         instance_path = info.get("instance_path", "")
-        instance_name = info.get("instance", "")
 
         # Check for lock file in instance path
-        if instance_path:
-            instance_locks = load_run_locks(Path(instance_path))
-        else:
-            instance_locks = load_run_locks(project)
+        if instance_path not in locks_by_path:
+            if instance_path:
+                locks_by_path[instance_path] = load_run_locks(Path(instance_path))
+            else:
+                # Fallback to local locks for old dispatch records
+                locks_by_path[instance_path] = load_run_locks(project)
+        instance_locks = locks_by_path[instance_path]
 
-        # Determine if process is running
-        is_running = False
         if story_id in instance_locks:
-            pid = instance_locks[story_id]["pid"]
-            if is_inside_devcontainer():
-                is_running = is_process_running(pid)
-            else:
-                is_running = is_process_running_in_container(instance_name, pid)
+            locked[story_id] = (info.get("instance", ""), instance_locks[story_id]["pid"])
+
+    return locked
+
+
+def get_running_pids(
+    probes: Iterable[tuple[str, int]], instances: list[dict] | None = None
+) -> set[tuple[str, int]]:
+    """
+    Check which (instance name, pid) processes are running.
+
+    Inside a devcontainer PIDs are checked locally. On the host they are
+    checked with one docker exec per container, and containers are checked
+    concurrently. Container names are looked up in instances if given,
+    instead of listing instances again.
+    """
+    probes = set(probes)
+
+    if is_inside_devcontainer():
+        return {probe for probe in probes if is_process_running(probe[1])}
+    if not probes:
+        return set()
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Fetch the instance list up front so the threads share it
+    if instances is None:
+        instances = list_instances()
+
+    pids_by_instance: dict[str, set[int]] = {}
+    for instance_name, pid in probes:
+        pids_by_instance.setdefault(instance_name, set()).add(pid)
+
+    def running_in_instance(instance_name: str) -> set[tuple[str, int]]:
+        container_name = get_container_name_for_instance(instance_name, instances)
+        if not container_name:
+            return set()
+        alive = check_pids_in_container(container_name, sorted(pids_by_instance[instance_name]))
+        return {(instance_name, pid) for pid, is_alive in alive.items() if is_alive}
+
+    with ThreadPoolExecutor(max_workers=min(8, len(pids_by_instance))) as pool:
+        return set().union(*pool.map(running_in_instance, pids_by_instance))
 
-        if not is_running:
+
+def get_stale_dispatches(project: Path, instances: list[dict] | None = None) -> list[dict]:
+    """
+    Find dispatched work that is no longer running.
+
+    Container names are looked up in instances if given, instead of
+    listing instances again.
+
+    Returns list of stale dispatch info dicts.
+    """
+    dispatched = load_dispatched(project)
+    locked = get_dispatch_pids(project, dispatched)
+    running = get_running_pids(locked.values(), instances)
+    stale = []
+
+    for story_id, info in dispatched.items():
+        if locked.get(story_id) not in running:
             stale.append({
                 "story_id": story_id,
-                "instance": instance_name,
-                "instance_path": instance_path,
+                "instance": info.get("instance", ""),
+                "instance_path": info.get("instance_path", ""),
                 "action": info.get("action", ""),
                 "started": info.get("started", ""),
             })
@@ -390,11 +620,48 @@ def colored(text: str, color: str, bold: bool = False) -> str:
     return f"{prefix}{color}{text}{Colors.END}"
 
 
+# Menu box drawing - inner width is 54 chars (between ║ markers).
+# The borders never change, so they are built once instead of per redraw.
+BOX_WIDTH = 54
+BOX_TOP = colored("╔" + "═" * BOX_WIDTH + "╗", Colors.BLUE)
+BOX_MID = colored("╠" + "═" * BOX_WIDTH + "╣", Colors.BLUE)
+BOX_BOT = colored("╚" + "═" * BOX_WIDTH + "╝", Colors.BLUE)
+BOX_EMPTY = colored("║" + " " * BOX_WIDTH + "║", Colors.BLUE)
+
+
+def truncate(text: str, width: int) -> str:
+    """Shorten text to at most width chars, ending in '...' if cut."""
+    return text if len(text) <= width else text[:width - 3] + "..."
+
+
+def box_line(text: str, color: str = Colors.BLUE, bold: bool = False) -> str:
+    """Format one menu line inside the box borders."""
+    # Truncate if too long, pad if too short
+    prefix = Colors.BOLD if bold else ""
+    return f"{prefix}{color}║{truncate(text, BOX_WIDTH).ljust(BOX_WIDTH)}║{Colors.END}"
+
+
+# Story status order for counts and epic summaries
+STATUS_DISPLAY_ORDER = ("done", "review", "in-progress", "ready-for-dev", "backlog")
+
+# Story status order for the stories-by-status listing (active work first)
+STATUS_LIST_ORDER = ("in-progress", "review", "ready-for-dev", "backlog", "done")
+
+EPIC_DISPLAY_ORDER = ("done", "in-progress", "backlog")
+
+STATUS_COLORS = {
+    "done": Colors.GREEN,
+    "review": Colors.YELLOW,
+    "in-progress": Colors.CYAN,
+    "ready-for-dev": Colors.BLUE,
+    "backlog": Colors.END,
+}
+
+
 def format_counts(counts: dict[str, int]) -> str:
     """Format status counts for display."""
     parts = []
-    order = ["done", "review", "in-progress", "ready-for-dev", "backlog"]
-    for status in order:
+    for status in STATUS_DISPLAY_ORDER:
         count = counts.get(status, 0)
         if count > 0:
             parts.append(f"{status}: {count}")
@@ -404,8 +671,7 @@ def format_counts(counts: dict[str, int]) -> str:
 def format_epic_counts(counts: dict[str, int]) -> str:
     """Format epic counts for display."""
     parts = []
-    order = ["done", "in-progress", "backlog"]
-    for status in order:
+    for status in EPIC_DISPLAY_ORDER:
         count = counts.get(status, 0)
         if count > 0:
             parts.append(f"{status}: {count}")
@@ -449,32 +715,27 @@ def display_stories_by_status(status: SprintStatus) -> None:
     print(colored("Stories by Status:", Colors.END, bold=True))
     print()
 
-    status_colors = {
-        "done": Colors.GREEN,
-        "review": Colors.YELLOW,
-        "in-progress": Colors.CYAN,
-        "ready-for-dev": Colors.BLUE,
-        "backlog": Colors.END,
-    }
-
-    order = ["in-progress", "review", "ready-for-dev", "backlog", "done"]
-    for s in order:
-        stories = by_status.get(s, [])
+    for s in STATUS_LIST_ORDER:
+        stories = by_status.get(s)
         if stories:
-            print(colored(f"  {s}:", status_colors.get(s, Colors.END), bold=True))
+            print(colored(f"  {s}:", STATUS_COLORS[s], bold=True))
             for story in stories:
                 print(f"    - {story}")
             print()
 
 
-def do_restart_story(project: Path, story_id: str, instances: list[dict]) -> int:
+def do_restart_story(project: Path, story_id: str, instances: list[dict],
+                     prefer_original: bool = True) -> int:
     """
     Restart a stale dispatch - shared logic for menu and restart command.
 
+    The original instance is the default choice if it is still running,
+    unless prefer_original is False.
     Returns 0 on success, 1 on failure.
     """
-    dispatched = load_dispatched(project)
-    info = dispatched.get(story_id, {})
+    store = get_dispatch_store(project)
+    previous = store.get(story_id)
+    info = previous or {}
     original_instance = info.get("instance", "")
     instance_path = info.get("instance_path", "")
 
@@ -489,7 +750,7 @@ def do_restart_story(project: Path, story_id: str, instances: list[dict]) -> int
         print(f"  {i}. {inst['name']}{marker}")
 
     # Prompt for instance selection
-    if original_available:
+    if original_available and prefer_original:
         default = str(next(i for i, inst in enumerate(instances, 1)
                           if inst["name"] == original_instance))
     else:
@@ -522,7 +783,7 @@ def do_restart_story(project: Path, story_id: str, instances: list[dict]) -> int
 
     cmd = f"./scripts/bmad-cli run-story {story_id}"
 
-    # Record new dispatch
+    # Record new dispatch - the only state write before exec
     record_dispatch(
         project, story_id,
         action="run-story",
@@ -534,7 +795,16 @@ def do_restart_story(project: Path, story_id: str, instances: list[dict]) -> int
     sys.stderr.flush()
 
     # Replace process with claude-instance run
-    os.execvp("./scripts/claude-instance", ["claude-instance", "run", selected_name, cmd])
+    try:
+        os.execvp("./scripts/claude-instance", ["claude-instance", "run", selected_name, cmd])
+    except OSError as e:
+        # Nothing was dispatched - put the previous record back
+        if previous is not None:
+            store.set(story_id, previous)
+        else:
+            store.pop(story_id)
+        print(colored(f"✗ Failed to run claude-instance: {e}", Colors.RED))
+        return 1
 
 
 def do_dispatch_next(project: Path, sprint_status: SprintStatus, instances: list[dict],
@@ -610,7 +880,7 @@ def do_dispatch_next(project: Path, sprint_status: SprintStatus, instances: list
 
 def cmd_menu(args: argparse.Namespace) -> int:
     """Handle interactive menu mode."""
-    project = Path(args.project).resolve()
+    project = Path(args.project)
 
     # Environment check - menu behavior differs in devcontainer
     if is_inside_devcontainer():
@@ -627,68 +897,49 @@ def cmd_menu(args: argparse.Namespace) -> int:
         print(colored(f"Error: {e}", Colors.RED))
         return 1
 
-    # Get stale dispatches
-    stale = get_stale_dispatches(project)
-    dispatched = load_dispatched(project)
-
     # Get running instances
     instances = get_running_instances()
 
-    # Get next action (excluding dispatched work)
-    next_action = get_next_action(sprint_status, skip_stories=set(dispatched.keys()))
-
-    # Box drawing helpers - inner width is 54 chars (between ║ markers)
-    W = 54
-
-    def box_top():
-        return colored("╔" + "═" * W + "╗", Colors.BLUE)
-
-    def box_mid():
-        return colored("╠" + "═" * W + "╣", Colors.BLUE)
-
-    def box_bot():
-        return colored("╚" + "═" * W + "╝", Colors.BLUE)
-
-    def box_line(text: str, color=Colors.BLUE, bold: bool = False) -> str:
-        # Truncate if too long, pad if too short
-        if len(text) > W:
-            text = text[:W-3] + "..."
-        return colored(f"║{text:<{W}}║", color, bold=bold)
+    # Get stale dispatches
+    stale = get_stale_dispatches(project, instances)
+    dispatched_ids = get_dispatch_store(project).story_ids
 
-    def box_empty():
-        return colored("║" + " " * W + "║", Colors.BLUE)
+    # Get next action (excluding dispatched work)
+    next_action = get_next_action(sprint_status, skip_stories=dispatched_ids)
+
+    # Header and status summary - sprint status isn't reloaded while the
+    # menu is open, so these lines are rendered once
+    story_summary = format_counts(sprint_status.counts)
+    epic_summary = format_epic_counts(sprint_status.epic_counts)
+    header = [
+        "",
+        BOX_TOP,
+        box_line("  BMAD Orchestrator", bold=True),
+        BOX_MID,
+        box_line(f"  Stories: {story_summary}"),
+        box_line(f"  Epics: {epic_summary}"),
+    ]
 
     # Build menu
     while True:
-        # Display header
-        print()
-        print(box_top())
-        print(box_line("  BMAD Orchestrator", bold=True))
-        print(box_mid())
-
-        # Status summary
-        story_summary = format_counts(sprint_status.counts)
-        print(box_line(f"  Stories: {story_summary}"))
-        epic_summary = format_epic_counts(sprint_status.epic_counts)
-        print(box_line(f"  Epics: {epic_summary}"))
+        # Frame lines are written in one go rather than a print() each
+        frame = header.copy()
 
         # Warnings section
         if stale:
-            print(box_mid())
+            frame.append(BOX_MID)
             for s in stale[:3]:  # Show max 3
                 # Truncate story_id if needed to fit warning
-                sid = s['story_id']
                 inst = s['instance']
-                max_sid = W - 15 - len(inst)  # "  ⚠  Stale:  @ " = ~15 chars
-                if len(sid) > max_sid:
-                    sid = sid[:max_sid-3] + "..."
+                max_sid = BOX_WIDTH - 15 - len(inst)  # "  ⚠  Stale:  @ " = ~15 chars
+                sid = truncate(s['story_id'], max_sid)
                 warn = f"  ⚠  Stale: {sid} @ {inst}"
-                print(box_line(warn, Colors.YELLOW))
+                frame.append(box_line(warn, Colors.YELLOW))
             if len(stale) > 3:
-                print(box_line(f"  ... and {len(stale) - 3} more stale dispatch(es)", Colors.YELLOW))
+                frame.append(box_line(f"  ... and {len(stale) - 3} more stale dispatch(es)", Colors.YELLOW))
 
         # Options section
-        print(box_mid())
+        frame.append(BOX_MID)
 
         options = []
         default_option = "1"
@@ -696,9 +947,7 @@ def cmd_menu(args: argparse.Namespace) -> int:
         # Option: Restart stale dispatches (priority if any exist)
         if stale:
             if len(stale) == 1:
-                sid = stale[0]['story_id']
-                if len(sid) > 30:
-                    sid = sid[:27] + "..."
+                sid = truncate(stale[0]['story_id'], 30)
                 opt_text = f"Restart stale: {sid}"
             else:
                 opt_text = f"Restart {len(stale)} stale dispatch(es)"
@@ -707,17 +956,13 @@ def cmd_menu(args: argparse.Namespace) -> int:
 
         # Option: Dispatch next
         if next_action and instances:
-            sid = next_action.story_id
-            if len(sid) > 20:
-                sid = sid[:17] + "..."
+            sid = truncate(next_action.story_id, 20)
             opt_text = f"Next story: {sid} ({next_action.type})"
             options.append(("next", opt_text))
             if not stale:
                 default_option = str(len(options))
         elif next_action and not instances:
-            sid = next_action.story_id
-            if len(sid) > 20:
-                sid = sid[:17] + "..."
+            sid = truncate(next_action.story_id, 20)
             opt_text = f"Next story: {sid} (no instances)"
             options.append(("next_no_inst", opt_text))
 
@@ -731,12 +976,14 @@ def cmd_menu(args: argparse.Namespace) -> int:
         options.append(("help", "Show help"))
 
         # Display options
-        print(box_empty())
+        frame.append(BOX_EMPTY)
         for i, (_, text) in enumerate(options, 1):
-            print(box_line(f"  {i}) {text}"))
-        print(box_line("  q) Quit"))
-        print(box_empty())
-        print(box_bot())
+            frame.append(box_line(f"  {i}) {text}"))
+        frame.append(box_line("  q) Quit"))
+        frame.append(BOX_EMPTY)
+        frame.append(BOX_BOT)
+        sys.stdout.write("\n".join(frame) + "\n")
+        sys.stdout.flush()
 
         # Prompt
         try:
@@ -762,8 +1009,8 @@ def cmd_menu(args: argparse.Namespace) -> int:
                 print("Start an instance with: claude-instance open <name>")
                 print()
                 if confirm("Clear stale dispatch(es) instead?", default_yes=False):
+                    clear_dispatches(project, [s["story_id"] for s in stale])
                     for s in stale:
-                        clear_dispatch(project, s["story_id"])
                         if s["instance_path"]:
                             try:
                                 remove_run_lock(Path(s["instance_path"]), s["story_id"])
@@ -789,8 +1036,8 @@ def cmd_menu(args: argparse.Namespace) -> int:
                 sub_choice = prompt(f"Select to restart [1-{len(stale)}/c/q]: ", default="1")
                 if sub_choice.lower() == "c":
                     if confirm("Clear all stale dispatches? Work will be lost.", default_yes=False):
+                        clear_dispatches(project, [s["story_id"] for s in stale])
                         for s in stale:
-                            clear_dispatch(project, s["story_id"])
                             if s["instance_path"]:
                                 try:
                                     remove_run_lock(Path(s["instance_path"]), s["story_id"])
@@ -810,7 +1057,7 @@ def cmd_menu(args: argparse.Namespace) -> int:
                         continue
 
         elif action_key == "next":
-            return do_dispatch_next(project, sprint_status, instances, set(dispatched.keys()))
+            return do_dispatch_next(project, sprint_status, instances, dispatched_ids)
 
         elif action_key == "next_no_inst":
             print()
@@ -828,7 +1075,7 @@ def cmd_menu(args: argparse.Namespace) -> int:
         elif action_key == "audit":
             # Run audit inline
             print()
-            args_ns = argparse.Namespace(project=str(project), fix=False)
+            args_ns = argparse.Namespace(project=project, fix=False)
             cmd_audit(args_ns)
             input("\nPress Enter to continue...")
             continue
@@ -856,7 +1103,7 @@ def cmd_menu(args: argparse.Namespace) -> int:
 
 def cmd_menu_devcontainer(args: argparse.Namespace) -> int:
     """Handle menu mode inside devcontainer."""
-    project = Path(args.project).resolve()
+    project = Path(args.project)
     instance_name = get_instance_name()
 
     # Load sprint status
@@ -872,62 +1119,42 @@ def cmd_menu_devcontainer(args: argparse.Namespace) -> int:
     # Get next action
     next_action = get_next_action(sprint_status)
 
-    # Box drawing helpers - inner width is 54 chars
-    W = 54
-
-    def box_top():
-        return colored("╔" + "═" * W + "╗", Colors.BLUE)
-
-    def box_mid():
-        return colored("╠" + "═" * W + "╣", Colors.BLUE)
-
-    def box_bot():
-        return colored("╚" + "═" * W + "╝", Colors.BLUE)
-
-    def box_line(text: str, color=Colors.BLUE, bold: bool = False) -> str:
-        if len(text) > W:
-            text = text[:W-3] + "..."
-        return colored(f"║{text:<{W}}║", color, bold=bold)
-
-    def box_empty():
-        return colored("║" + " " * W + "║", Colors.BLUE)
+    options = []
+    if next_action:
+        # Truncate long story IDs to fit in menu
+        sid = truncate(next_action.story_id, 22)
+        opt_text = f"Run next: {sid} ({next_action.type})"
+        options.append(("run_next", opt_text, next_action.story_id))
+    else:
+        options.append(("done", "All stories complete!", None))
+
+    options.append(("run_story", "Run specific story", None))
+    options.append(("run_epic", "Run specific epic", None))
+    options.append(("stories", "View stories by status", None))
+
+    # Nothing on this menu changes while it is open, so the whole frame
+    # is rendered once
+    story_summary = format_counts(sprint_status.counts)
+    frame = [
+        "",
+        BOX_TOP,
+        box_line(f"  BMAD - {instance_name or 'devcontainer'}", bold=True),
+        BOX_MID,
+        box_line(f"  Stories: {story_summary}"),
+        BOX_MID,
+        BOX_EMPTY,
+    ]
+    for i, (_, text, _) in enumerate(options, 1):
+        frame.append(box_line(f"  {i}) {text}"))
+    frame.append(box_line("  q) Quit"))
+    frame.append(BOX_EMPTY)
+    frame.append(BOX_BOT)
+    frame_text = "\n".join(frame) + "\n"
 
     # Show simplified menu for devcontainer
     while True:
-        print()
-        print(box_top())
-        print(box_line(f"  BMAD - {instance_name or 'devcontainer'}", bold=True))
-        print(box_mid())
-
-        # Status summary
-        story_summary = format_counts(sprint_status.counts)
-        print(box_line(f"  Stories: {story_summary}"))
-
-        # Options
-        print(box_mid())
-        print(box_empty())
-
-        options = []
-
-        if next_action:
-            # Truncate long story IDs to fit in menu
-            sid = next_action.story_id
-            if len(sid) > 22:
-                sid = sid[:19] + "..."
-            opt_text = f"Run next: {sid} ({next_action.type})"
-            options.append(("run_next", opt_text, next_action.story_id))
-        else:
-            options.append(("done", "All stories complete!", None))
-
-        options.append(("run_story", "Run specific story", None))
-        options.append(("run_epic", "Run specific epic", None))
-        options.append(("stories", "View stories by status", None))
-
-        for i, (_, text, _) in enumerate(options, 1):
-            print(box_line(f"  {i}) {text}"))
-        print(box_line("  q) Quit"))
-        print(box_empty())
-        print(box_bot())
+        sys.stdout.write(frame_text)
+        sys.stdout.flush()
 
         try:
             choice = prompt("\nSelect [1]: ", default="1")
@@ -944,53 +1171,59 @@ def cmd_menu_devcontainer(args: argparse.Namespace) -> int:
             continue
 
         action_key, _, story_id = options[idx]
+        result = DEVCONTAINER_MENU_ACTIONS[action_key](project, story_id, sprint_status)
+        if result is not None:
+            return result
 
-        if action_key == "run_next":
-            # Create namespace and call run-story
-            run_args = argparse.Namespace(
-                project=str(project),
-                story_id=story_id,
-                dry_run=False,
-            )
-            return cmd_run_story(run_args)
-
-        elif action_key == "done":
-            print(colored("\n✓ All stories complete!", Colors.GREEN))
-            return 0
 
-        elif action_key == "run_story":
-            story_id = prompt("\nEnter story ID: ")
-            if not story_id:
-                continue
-            run_args = argparse.Namespace(
-                project=str(project),
-                story_id=story_id,
-                dry_run=False,
-            )
-            return cmd_run_story(run_args)
-
-        elif action_key == "run_epic":
-            epic_id = prompt("\nEnter epic ID (e.g., epic-1): ")
-            if not epic_id:
-                continue
-            run_args = argparse.Namespace(
-                project=str(project),
-                epic_id=epic_id,
-                dry_run=False,
-            )
-            return cmd_run_epic(run_args)
+def _menu_run_story(project: Path, story_id: str | None, sprint_status: SprintStatus) -> int | None:
+    """Run the given story, or prompt for one if story_id is None."""
+    if story_id is None:
+        story_id = prompt("\nEnter story ID: ")
+        if not story_id:
+            return None
+    return cmd_run_story(
+        argparse.Namespace(project=project, story_id=story_id, dry_run=False)
+    )
 
-        elif action_key == "stories":
-            display_stories_by_status(sprint_status)
-            input("\nPress Enter to continue...")
-            continue
 
+def _menu_run_epic(project: Path, story_id: str | None, sprint_status: SprintStatus) -> int | None:
+    """Prompt for an epic ID and run it."""
+    epic_id = prompt("\nEnter epic ID (e.g., epic-1): ")
+    if not epic_id:
+        return None
+    return cmd_run_epic(
+        argparse.Namespace(project=project, epic_id=epic_id, dry_run=False)
+    )
+
+
+def _menu_show_stories(project: Path, story_id: str | None, sprint_status: SprintStatus) -> int | None:
+    """Show stories by status and wait for Enter."""
+    display_stories_by_status(sprint_status)
+    input("\nPress Enter to continue...")
+    return None
+
+
+def _menu_done(project: Path, story_id: str | None, sprint_status: SprintStatus) -> int | None:
+    """Report that there is nothing left to run."""
+    print(colored("\n✓ All stories complete!", Colors.GREEN))
     return 0
 
 
+# Devcontainer menu handlers by action key. Each returns an exit code,
+# or None to show the menu again.
+DEVCONTAINER_MENU_ACTIONS = {
+    "run_next": _menu_run_story,
+    "run_story": _menu_run_story,
+    "run_epic": _menu_run_epic,
+    "stories": _menu_show_stories,
+    "done": _menu_done,
+}
+
+
 def cmd_status(args: argparse.Namespace) -> int:
     """Handle 'status' command."""
-    project = Path(args.project).resolve()
+    project = Path(args.project)
 
     try:
         sprint_status = load_sprint_status(project)
@@ -1012,7 +1245,7 @@ def cmd_status(args: argparse.Namespace) -> int:
 
 def cmd_next(args: argparse.Namespace) -> int:
     """Handle 'next' command. Auto-dispatches to instance when on host."""
-    project = Path(args.project).resolve()
+    project = Path(args.project)
 
     # Environment check - next is for dispatching from host
     if is_inside_devcontainer():
@@ -1030,10 +1263,16 @@ def cmd_next(args: argparse.Namespace) -> int:
         print(colored(f"Error: {e}", Colors.RED))
         return 1
 
-    # Auto-audit: Check for stale dispatches first
-    stale = get_stale_dispatches(project)
+    # Auto-audit: Check for stale dispatches first. With nothing
+    # dispatched there is nothing to audit, and instances are only
+    # listed once there is work to dispatch.
     dispatched = load_dispatched(project)
-    instances = get_running_instances()
+    if dispatched:
+        instances = get_running_instances()
+        stale = get_stale_dispatches(project, instances)
+    else:
+        instances = None
+        stale = []
 
     if stale:
         print()
@@ -1049,14 +1288,13 @@ def cmd_next(args: argparse.Namespace) -> int:
                     return do_restart_story(project, stale[0]["story_id"], instances)
                 elif confirm("Clear stale dispatch and continue?", default_yes=False):
                     clear_dispatch(project, stale[0]["story_id"])
+                    dispatched.pop(stale[0]["story_id"], None)
                     if stale[0]["instance_path"]:
                         try:
                             remove_run_lock(Path(stale[0]["instance_path"]), stale[0]["story_id"])
                         except Exception:
                             pass
                     print(colored("✓ Cleared.", Colors.GREEN))
-                    # Refresh dispatched after clearing
-                    dispatched = load_dispatched(project)
                 else:
                     print("\nContinuing to next available story...")
             else:
@@ -1071,32 +1309,32 @@ def cmd_next(args: argparse.Namespace) -> int:
                     print("  or: bmad restart <story-id>")
                     return 0
                 elif choice == "2":
+                    clear_dispatches(project, [s["story_id"] for s in stale])
                     for s in stale:
-                        clear_dispatch(project, s["story_id"])
+                        dispatched.pop(s["story_id"], None)
                         if s["instance_path"]:
                             try:
                                 remove_run_lock(Path(s["instance_path"]), s["story_id"])
                             except Exception:
                                 pass
                     print(colored(f"✓ Cleared {len(stale)} stale dispatch(es).", Colors.GREEN))
-                    dispatched = load_dispatched(project)
                 # choice == "3" or default: continue
         else:
             print("No running instances available to restart on.")
             if confirm("Clear stale dispatches?", default_yes=True):
+                clear_dispatches(project, [s["story_id"] for s in stale])
                 for s in stale:
-                    clear_dispatch(project, s["story_id"])
+                    dispatched.pop(s["story_id"], None)
                     if s["instance_path"]:
                         try:
                             remove_run_lock(Path(s["instance_path"]), s["story_id"])
                         except Exception:
                             pass
                 print(colored(f"✓ Cleared {len(stale)} stale dispatch(es).", Colors.GREEN))
-                dispatched = load_dispatched(project)
 
     # Show any active (non-stale) dispatched work
-    active_dispatched = {k: v for k, v in dispatched.items()
-                         if k not in [s["story_id"] for s in stale]}
+    stale_ids = {s["story_id"] for s in stale}
+    active_dispatched = {k: v for k, v in dispatched.items() if k not in stale_ids}
     if active_dispatched:
         print()
         print(colored("In-progress (active):", Colors.CYAN, bold=True))
@@ -1105,7 +1343,8 @@ def cmd_next(args: argparse.Namespace) -> int:
         print()
 
     # Find next action that isn't already dispatched
-    action = get_next_action(sprint_status, skip_stories=set(dispatched.keys()))
+    dispatched_ids = set(dispatched)
+    action = get_next_action(sprint_status, skip_stories=dispatched_ids)
 
     if action is None:
         if dispatched:
@@ -1114,8 +1353,7 @@ def cmd_next(args: argparse.Namespace) -> int:
             print(colored("All stories complete! Nothing to do.", Colors.GREEN))
         return 0
 
-    # Get running instances if not already fetched
-    if not instances:
+    if instances is None:
         instances = get_running_instances()
 
     if not instances:
@@ -1131,11 +1369,17 @@ def cmd_next(args: argparse.Namespace) -> int:
         return 1
 
     # Use shared dispatch function
-    return do_dispatch_next(project, sprint_status, instances, set(dispatched.keys()))
+    return do_dispatch_next(project, sprint_status, instances, dispatched_ids)
 
 
 def cmd_run_story(args: argparse.Namespace) -> int:
     """Handle 'run-story' command. Must run inside devcontainer."""
+    import atexit
+    import signal
+
+    # Deferred: the executor (pty, termios) is only needed to run work
+    from .executor import run_story_to_completion
+
     # Environment check
     if not is_inside_devcontainer():
         print(colored("Error: 'run-story' must run inside a devcontainer", Colors.RED))
@@ -1145,7 +1389,7 @@ def cmd_run_story(args: argparse.Namespace) -> int:
         print(f"  claude-instance run <name> ./scripts/bmad-cli run-story <id>")
         return 1
 
-    project = Path(args.project).resolve()
+    project = Path(args.project)
     story_id = args.story_id
 
     try:
@@ -1238,6 +1482,8 @@ def cmd_run_story(args: argparse.Namespace) -> int:
 
 def cmd_run_epic(args: argparse.Namespace) -> int:
     """Handle 'run-epic' command. Must run inside devcontainer."""
+    from .executor import run_epic_to_completion
+
     # Environment check
     if not is_inside_devcontainer():
         print(colored("Error: 'run-epic' must run inside a devcontainer", Colors.RED))
@@ -1246,7 +1492,7 @@ def cmd_run_epic(args: argparse.Namespace) -> int:
         print(f"  claude-instance run <name> ./scripts/bmad-cli run-epic <id>")
         return 1
 
-    project = Path(args.project).resolve()
+    project = Path(args.project)
     epic_id = args.epic_id
 
     try:
@@ -1259,13 +1505,17 @@ def cmd_run_epic(args: argparse.Namespace) -> int:
         print(colored(f"Error: Epic '{epic_id}' not found", Colors.RED))
         return 1
 
-    # Find all stories for this epic
+    # Find all stories for this epic, grouped by status, in one pass
     epic_num = epic_id.replace("epic-", "")
-    epic_stories = {
-        sid: status
-        for sid, status in sprint_status.stories.items()
-        if sid.startswith(f"{epic_num}-")
-    }
+    epic_stories: dict[str, str] = {}
+    by_status: dict[str, list[str]] = {}
+    remaining: list[str] = []
+    for sid in sprint_status.epic_index.get(epic_num, []):
+        s = sprint_status.stories[sid]
+        epic_stories[sid] = s
+        by_status.setdefault(s, []).append(sid)
+        if s != "done":
+            remaining.append(sid)
 
     if not epic_stories:
         print(colored(f"No stories found for {epic_id}", Colors.YELLOW))
@@ -1277,15 +1527,10 @@ def cmd_run_epic(args: argparse.Namespace) -> int:
     print()
 
     # Count by status
-    by_status: dict[str, list[str]] = {}
-    for sid, s in sorted(epic_stories.items()):
-        by_status.setdefault(s, []).append(sid)
-
-    for s in ["done", "review", "in-progress", "ready-for-dev", "backlog"]:
-        if s in by_status:
-            print(f"  {s}: {', '.join(by_status[s])}")
-
-    remaining = [sid for sid, s in epic_stories.items() if s != "done"]
+    for s in STATUS_DISPLAY_ORDER:
+        sids = by_status.get(s)
+        if sids:
+            print(f"  {s}: {', '.join(sids)}")
 
     if not remaining:
         print(colored("\nAll stories in epic complete!", Colors.GREEN))
@@ -1293,7 +1538,7 @@ def cmd_run_epic(args: argparse.Namespace) -> int:
 
     print()
     print(colored(f"Stories to complete: {len(remaining)}", Colors.END, bold=True))
-    for sid in sorted(remaining):
+    for sid in remaining:
         print(f"  - {sid} ({epic_stories[sid]})")
 
     if args.dry_run:
@@ -1316,41 +1561,32 @@ def cmd_run_epic(args: argparse.Namespace) -> int:
     result = run_epic_to_completion(epic_id, project_path=project, yolo=yolo)
 
     # Clear dispatch records for all stories that finished (completed or failed)
-    for sid in result.stories_completed:
-        clear_dispatch(project, sid)
-    for msg in result.stories_failed:
-        # stories_failed contains "story_id: reason" format
-        sid = msg.split(":")[0].strip()
-        clear_dispatch(project, sid)
-
-    # Display results
-    print()
+    clear_dispatches(project, result.stories_completed + result.failed_ids)
+
+    # Display results, written in one go
+    out = [""]
     if result.stories_completed:
-        print(colored(f"✓ Completed: {len(result.stories_completed)}", Colors.GREEN))
-        for sid in result.stories_completed:
-            print(f"    {sid}")
+        out.append(colored(f"✓ Completed: {len(result.stories_completed)}", Colors.GREEN))
+        out.extend(f"    {sid}" for sid in result.stories_completed)
 
     if result.stories_failed:
-        print(colored(f"✗ Failed: {len(result.stories_failed)}", Colors.RED))
-        for msg in result.stories_failed:
-            print(f"    {msg}")
+        out.append(colored(f"✗ Failed: {len(result.stories_failed)}", Colors.RED))
+        out.extend(f"    {msg}" for msg in result.stories_failed)
+        sys.stdout.write("\n".join(out) + "\n")
         return 1
 
     if result.stories_skipped:
-        print(colored(f"○ Skipped: {len(result.stories_skipped)}", Colors.YELLOW))
-        for sid in result.stories_skipped:
-            print(f"    {sid}")
-
-    if not result.stories_failed:
-        print(colored("\n✓ Epic complete!", Colors.GREEN))
-        return 0
+        out.append(colored(f"○ Skipped: {len(result.stories_skipped)}", Colors.YELLOW))
+        out.extend(f"    {sid}" for sid in result.stories_skipped)
 
-    return 1
+    out.append(colored("\n✓ Epic complete!", Colors.GREEN))
+    sys.stdout.write("\n".join(out) + "\n")
+    return 0
 
 
 def cmd_clear_dispatch(args: argparse.Namespace) -> int:
     """Handle 'clear-dispatch' command to fix stuck dispatch state."""
-    project = Path(args.project).resolve()
+    project = Path(args.project)
     dispatched = load_dispatched(project)
 
     if not dispatched:
@@ -1391,45 +1627,33 @@ def cmd_clear_dispatch(args: argparse.Namespace) -> int:
 
 def cmd_audit(args: argparse.Namespace) -> int:
     """Handle 'audit' command to verify dispatch state."""
-    project = Path(args.project).resolve()
+    project = Path(args.project)
 
     dispatched = load_dispatched(project)
     local_locks = load_run_locks(project)
 
-    print()
-    print(colored("BMAD State Audit", Colors.END, bold=True))
-    print("=" * 40)
+    # Check every process once, batched per container, for both the
+    # report and --fix. Dispatches to this project reuse local_locks.
+    locks_by_path = {"": local_locks, str(project): local_locks}
+    locked = get_dispatch_pids(project, dispatched, locks_by_path)
+    running = get_running_pids(locked.values())
+    local_running = {
+        story_id: is_process_running(lock["pid"]) for story_id, lock in local_locks.items()
+    }
+
+    out = ["", colored("BMAD State Audit", Colors.END, bold=True), "=" * 40]
 
     issues_found = 0
 
     # Check dispatched work against lock files in each instance's path
-    print()
-    print(colored("Dispatched (sent to instances):", Colors.CYAN))
+    out.append("")
+    out.append(colored("Dispatched (sent to instances):", Colors.CYAN))
     if not dispatched:
-        print("  (none)")
+        out.append("  (none)")
     else:
         for story_id, info in dispatched.items():
-            # Look for lock file in the instance's path
-            instance_path = info.get("instance_path", "")
-            if instance_path:
-                instance_locks = load_run_locks(Path(instance_path))
-            else:
-                # Fallback to local locks for old dispatch records
-                instance_locks = local_locks
-
-            if story_id in instance_locks:
-                lock = instance_locks[story_id]
-                instance_name = info.get("instance", "")
-                # Check process inside the container, not locally
-                if is_inside_devcontainer():
-                    # Inside container: check locally
-                    is_running = is_process_running(lock["pid"])
-                else:
-                    # On host: check inside the target container
-                    is_running = is_process_running_in_container(
-                        instance_name, lock["pid"]
-                    )
-                if is_running:
+            if story_id in locked:
+                if locked[story_id] in running:
                     status = colored("✓ running", Colors.GREEN)
                 else:
                     status = colored("✗ stale (process dead)", Colors.RED)
@@ -1438,71 +1662,61 @@ def cmd_audit(args: argparse.Namespace) -> int:
                 # No lock = command never started or already finished
                 status = colored("✗ not running (no lock)", Colors.RED)
                 issues_found += 1
-            print(f"  {story_id} @ {info['instance']} - {status}")
+            out.append(f"  {story_id} @ {info['instance']} - {status}")
 
     # Check local lock files (for runs started in this instance)
-    print()
-    print(colored("Local lock files:", Colors.CYAN))
+    out.append("")
+    out.append(colored("Local lock files:", Colors.CYAN))
     if not local_locks:
-        print("  (none)")
+        out.append("  (none)")
     else:
         for story_id, lock in local_locks.items():
             pid = lock["pid"]
-            if is_process_running(pid):
+            if local_running[story_id]:
                 status = colored(f"✓ running (pid {pid})", Colors.GREEN)
             else:
                 status = colored(f"✗ stale (pid {pid} dead)", Colors.RED)
                 issues_found += 1
-            print(f"  {story_id} - {status}")
+            out.append(f"  {story_id} - {status}")
 
     # Summary
-    print()
+    out.append("")
     if issues_found == 0:
-        print(colored("✓ No issues found.", Colors.GREEN))
+        out.append(colored("✓ No issues found.", Colors.GREEN))
     else:
-        print(colored(f"✗ {issues_found} issue(s) found.", Colors.RED))
-        print()
-        print("To fix: bmad audit --fix")
+        out.append(colored(f"✗ {issues_found} issue(s) found.", Colors.RED))
+        out.append("")
+        out.append("To fix: bmad audit --fix")
+
+    # Report lines are collected and written in one go
+    sys.stdout.write("\n".join(out) + "\n")
 
     # Auto-fix if requested
     if args.fix and issues_found > 0:
-        print()
-        print(colored("Fixing issues...", Colors.YELLOW))
+        out = ["", colored("Fixing issues...", Colors.YELLOW)]
 
         # Clear stale local locks
-        for story_id, lock in local_locks.items():
-            if not is_process_running(lock["pid"]):
+        for story_id in local_locks:
+            if not local_running[story_id]:
                 remove_run_lock(project, story_id)
-                print(f"  Removed stale local lock: {story_id}")
+                out.append(f"  Removed stale local lock: {story_id}")
 
         # Clear dispatches with no active lock (check in instance path)
-        for story_id, info in list(dispatched.items()):
-            instance_path = info.get("instance_path", "")
-            instance_name = info.get("instance", "")
-            if instance_path:
-                instance_locks = load_run_locks(Path(instance_path))
-            else:
-                instance_locks = local_locks
-
-            # Check if process is running (container-aware)
-            if story_id in instance_locks:
-                pid = instance_locks[story_id]["pid"]
-                if is_inside_devcontainer():
-                    is_running = is_process_running(pid)
-                else:
-                    is_running = is_process_running_in_container(instance_name, pid)
-            else:
-                is_running = False
-
-            if not is_running:
+        stale_ids = []
+        for story_id, info in dispatched.items():
+            if locked.get(story_id) not in running:
                 # Also try to clean up lock in instance path
-                if instance_path and story_id in instance_locks:
+                instance_path = info.get("instance_path", "")
+                if instance_path and story_id in locked:
                     remove_run_lock(Path(instance_path), story_id)
-                    print(f"  Removed stale instance lock: {story_id}")
-                clear_dispatch(project, story_id)
-                print(f"  Cleared stale dispatch: {story_id}")
+                    out.append(f"  Removed stale instance lock: {story_id}")
+                stale_ids.append(story_id)
+                out.append(f"  Cleared stale dispatch: {story_id}")
+        # One write of the dispatch file for all of them
+        clear_dispatches(project, stale_ids)
 
-        print(colored("✓ Fixed.", Colors.GREEN))
+        out.append(colored("✓ Fixed.", Colors.GREEN))
+        sys.stdout.write("\n".join(out) + "\n")
 
     return 1 if issues_found > 0 else 0
 
@@ -1515,7 +1729,7 @@ def cmd_restart(args: argparse.Namespace) -> int:
         print("  bmad run-story <id>    # Run a specific story")
         return 1
 
-    project = Path(args.project).resolve()
+    project = Path(args.project)
     story_id = args.story_id
     dispatched = load_dispatched(project)
 
@@ -1527,84 +1741,23 @@ def cmd_restart(args: argparse.Namespace) -> int:
                 print(f"  - {sid}")
         return 1
 
-    info = dispatched[story_id]
-    original_instance = info.get("instance", "")
-    instance_path = info.get("instance_path", "")
-
     print(f"Story: {colored(story_id, Colors.CYAN)}")
-    print(f"Originally dispatched to: {original_instance}")
-    print()
+    print(f"Originally dispatched to: {dispatched[story_id].get('instance', '')}")
 
     # Get available instances
     instances = get_running_instances()
     if not instances:
+        print()
         print(colored("No running instances found.", Colors.RED))
         print("Create one with: claude-instance create <name>")
         return 1
 
-    # Check if original instance is still available
-    original_available = any(i["name"] == original_instance for i in instances)
-
-    # Show options
-    print("Running instances:")
-    for i, inst in enumerate(instances, 1):
-        marker = " (original)" if inst["name"] == original_instance else ""
-        print(f"  {i}. {inst['name']}{marker}")
-
-    # Prompt for instance selection
-    if original_available and not args.different:
-        default = str(next(i for i, inst in enumerate(instances, 1)
-                          if inst["name"] == original_instance))
-    else:
-        default = "1"
-
-    choice = prompt(f"\nSelect instance [1-{len(instances)}/q]: ", default=default)
-
-    try:
-        idx = int(choice) - 1
-        if idx < 0 or idx >= len(instances):
-            raise ValueError()
-    except ValueError:
-        print(colored("Invalid selection.", Colors.RED))
-        return 1
-
-    selected = instances[idx]
-    selected_name = selected["name"]
-    selected_path = selected["path"]
-
-    # Clean up any stale lock in the original instance
-    if instance_path:
-        try:
-            remove_run_lock(Path(instance_path), story_id)
-        except Exception:
-            pass  # Lock may not exist
-
-    # Dispatch to selected instance
-    print()
-    print(f"Restarting {colored(story_id, Colors.CYAN)} on {colored(selected_name, Colors.GREEN)}...")
+    return do_restart_story(project, story_id, instances, prefer_original=not args.different)
 
-    # Build command - use run-story to resume from current state
-    cmd = f"./scripts/bmad-cli run-story {story_id}"
 
-    # Record new dispatch (overwrites old entry - no need to clear first)
-    record_dispatch(
-        project,
-        story_id,
-        action="run-story",
-        instance=selected_name,
-        instance_path=selected_path,
-    )
-
-    # Flush output before exec
-    sys.stdout.flush()
-    sys.stderr.flush()
-
-    # Replace this process with claude-instance run (fully transparent)
-    os.execvp("./scripts/claude-instance", ["claude-instance", "run", selected_name, cmd])
-
-
-def main() -> int:
-    """Entry point for the CLI."""
+@cache
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser (once per process)."""
     parser = argparse.ArgumentParser(
         prog="bmad",
         description="BMAD Orchestrator - Workflow automation for AI-driven development",
@@ -1692,30 +1845,34 @@ def main() -> int:
         help="Default to a different instance than original"
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+# Handler for each subcommand
+COMMANDS = {
+    "menu": cmd_menu,
+    "status": cmd_status,
+    "next": cmd_next,
+    "run-story": cmd_run_story,
+    "run-epic": cmd_run_epic,
+    "clear-dispatch": cmd_clear_dispatch,
+    "audit": cmd_audit,
+    "restart": cmd_restart,
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for the CLI."""
+    args = build_parser().parse_args(argv)
+
+    # Resolve the project path once; handlers take args.project as-is
+    args.project = Path(args.project).resolve()
 
     # Default to menu when no command given
     if args.command is None:
         args.command = "menu"
 
-    if args.command == "menu":
-        return cmd_menu(args)
-    elif args.command == "status":
-        return cmd_status(args)
-    elif args.command == "next":
-        return cmd_next(args)
-    elif args.command == "run-story":
-        return cmd_run_story(args)
-    elif args.command == "run-epic":
-        return cmd_run_epic(args)
-    elif args.command == "clear-dispatch":
-        return cmd_clear_dispatch(args)
-    elif args.command == "audit":
-        return cmd_audit(args)
-    elif args.command == "restart":
-        return cmd_restart(args)
-
-    return 0
+    return COMMANDS[args.command](args)
 
 
 if __name__ == "__main__":
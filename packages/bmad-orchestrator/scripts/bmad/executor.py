@@ -5,11 +5,17 @@ Handles local execution of BMAD workflows inside a devcontainer.
 Dispatching to instances is handled by the CLI via claude-instance run.
 """
 
+import errno
+import fcntl
 import json
 import os
 import pty
+import re
 import select
+import selectors
 import signal
+import stat
+import struct
 import sys
 import termios
 import time
@@ -18,11 +24,147 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from .fileutil import atomic_write_bytes
 from .status import Action, find_sprint_status_file, load_sprint_status
 
 # Signal file path for phase completion detection
 SIGNAL_FILE = ".claude/.bmad-phase-signal.json"
 
+# Max bytes per read when forwarding PTY I/O (the Linux pipe capacity)
+PTY_CHUNK = 65536
+
+# Max bytes of child output gathered per wakeup before writing it out,
+# so a child that never pauses can't starve input and signal checks
+PTY_DRAIN_MAX = 16 * PTY_CHUNK
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to fd, looping over short writes."""
+    view = memoryview(data)
+    while view:
+        try:
+            view = view[os.write(fd, view):]
+        except BlockingIOError:
+            # Non-blocking fd is full - wait until it can take more
+            select.select([], [fd], [])
+
+
+def _copy_pending(src_fd: int, dst_fd: int) -> bool:
+    """
+    Read everything pending on non-blocking src_fd and write it to dst_fd
+    with one write (at most PTY_DRAIN_MAX bytes per call).
+
+    Returns True if src_fd is closed. Write errors are raised.
+    """
+    output = bytearray()
+    closed = False
+    while len(output) < PTY_DRAIN_MAX:
+        try:
+            data = os.read(src_fd, PTY_CHUNK)
+        except BlockingIOError:
+            break
+        except OSError:
+            closed = True  # EIO from the pty master once the child is gone
+            break
+        if not data:
+            closed = True
+            break
+        output += data
+    if output:
+        _write_all(dst_fd, output)
+    return closed
+
+
+def _splice_pending(src_fd: int, pipe_fd: int) -> bool:
+    """
+    Move everything pending on non-blocking src_fd into pipe_fd with
+    os.splice (at most PTY_DRAIN_MAX bytes per call).
+
+    Returns True if src_fd is closed. Raises OSError with EINVAL if the
+    kernel can't splice from src_fd, and on write errors.
+    """
+    moved = 0
+    while moved < PTY_DRAIN_MAX:
+        try:
+            n = os.splice(src_fd, pipe_fd, PTY_CHUNK, flags=os.SPLICE_F_MOVE)
+        except BlockingIOError:
+            return False
+        except OSError as e:
+            if e.errno == errno.EIO:
+                return True  # pty master once the child is gone
+            raise
+        if n == 0:
+            return True
+        moved += n
+    return False
+
+
+# inotify event masks (from <sys/inotify.h>)
+_IN_CREATE = 0x00000100
+_IN_MOVED_TO = 0x00000080
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+
+
+def _inotify_watch(directory: Path) -> int | None:
+    """
+    Watch a directory for new files with inotify.
+
+    Returns a non-blocking inotify fd, or None where inotify isn't
+    available (non-Linux, missing directory) so callers can poll instead.
+    """
+    if sys.platform != "linux" or not directory.is_dir():
+        return None
+
+    import ctypes
+
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    mask = _IN_CREATE | _IN_MOVED_TO | _IN_MOVE_SELF
+    if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+def _read_inotify_names(fd: int) -> tuple[set[str], bool, bool]:
+    """
+    Drain pending inotify events.
+
+    Returns the file names created or moved in, whether the watch was
+    removed or moved (e.g. the directory was deleted or renamed), and
+    whether the event queue overflowed so names may be missing.
+    """
+    names: set[str] = set()
+    watch_lost = False
+    overflowed = False
+    while True:
+        try:
+            buf = os.read(fd, PTY_CHUNK)
+        except BlockingIOError:
+            break
+        if not buf:
+            break
+        offset = 0
+        # struct inotify_event: int wd; uint32 mask, cookie, len; char name[len]
+        while offset + 16 <= len(buf):
+            _, mask, _, name_len = struct.unpack_from("iIII", buf, offset)
+            offset += 16
+            if mask & (_IN_IGNORED | _IN_MOVE_SELF):
+                watch_lost = True
+            if mask & _IN_Q_OVERFLOW:
+                overflowed = True
+            if name_len:
+                names.add(os.fsdecode(buf[offset:offset + name_len].rstrip(b"\0")))
+            offset += name_len
+    return names, watch_lost, overflowed
+
 
 def _pty_spawn_with_signal(
     cmd: list[str], project_path: Path, check_interval: float = 0.5
@@ -30,13 +172,17 @@ def _pty_spawn_with_signal(
     """
     Spawn a command in a PTY with signal file watching.
 
-    Like pty.spawn() but periodically checks for the signal file.
+    Like pty.spawn() but watches for the signal file. On Linux the
+    signal file's directory is watched with inotify, so the file is seen
+    as soon as it is created; it is also checked whenever the wait times
+    out, in case an inotify event was lost.
     When the signal file is detected, terminates the child process.
 
     Args:
         cmd: Command to execute
         project_path: Path to project root (for signal file)
-        check_interval: How often to check for signal file (seconds)
+        check_interval: How often to poll for signal file (seconds)
+            while there is no I/O
 
     Returns:
         Tuple of (exit_status in waitpid format, was_signaled)
@@ -54,6 +200,9 @@ def _pty_spawn_with_signal(
     # Parent process - I/O loop with signal watching
     was_signaled = False
 
+    # Non-blocking, so each wakeup can drain all pending output
+    fcntl.fcntl(master_fd, fcntl.F_SETFL, fcntl.fcntl(master_fd, fcntl.F_GETFL) | os.O_NONBLOCK)
+
     # Save terminal settings and set to raw mode
     stdin_fd = sys.stdin.fileno()
     try:
@@ -65,12 +214,45 @@ def _pty_spawn_with_signal(
         restore_terminal = False
         old_settings = None
 
+    inotify_fd = _inotify_watch(signal_file.parent)
+
+    # The file may exist before the watch started, so check once up
+    # front; after that when inotify reports it or the wait times out
+    check_signal = True
+
+    # Plain str path for the loop - os.path calls skip Path method overhead
+    signal_path = os.fspath(signal_file)
+
+    # Linux can move child output straight into a stdout pipe without
+    # copying it through user space; ttys can't be spliced into. Only a
+    # blocking pipe - a full non-blocking one would look like a drained
+    # master to _splice_pending, so the loop would spin
+    stdout_fd = sys.stdout.fileno()
+    splice_output = (
+        hasattr(os, "splice")
+        and stat.S_ISFIFO(os.fstat(stdout_fd).st_mode)
+        and os.get_blocking(stdout_fd)
+    )
+
+    # Register the fds once rather than passing them on every wait
+    sel = selectors.DefaultSelector()
+    sel.register(master_fd, selectors.EVENT_READ)
+    # epoll refuses regular files; a file stdin is always readable, so it
+    # is forwarded a chunk per iteration without waiting on it
+    stdin_from_file = False
+    try:
+        sel.register(stdin_fd, selectors.EVENT_READ)
+    except (PermissionError, ValueError):
+        stdin_from_file = True
+    if inotify_fd is not None:
+        sel.register(inotify_fd, selectors.EVENT_READ)
+
     try:
         while True:
             # Check for signal file
-            if signal_file.exists():
+            if check_signal and os.path.exists(signal_path):
                 try:
-                    signal_file.unlink()
+                    os.unlink(signal_path)
                 except FileNotFoundError:
                     pass  # Race condition - file already deleted, this is fine
                 except OSError as e:
@@ -81,28 +263,58 @@ def _pty_spawn_with_signal(
                 was_signaled = True
                 break
 
+            check_signal = inotify_fd is None
+
             # Wait for I/O with timeout for signal checking
             try:
-                rfds, _, _ = select.select([master_fd, stdin_fd], [], [], check_interval)
-            except (select.error, ValueError):
+                events = sel.select(0 if stdin_from_file else check_interval)
+            except (OSError, ValueError):
                 break
-
-            # Handle output from child
+            if not events:
+                check_signal = True
+            rfds = {key.fd for key, _ in events}
+
+            # Handle new files next to the signal file
+            if inotify_fd is not None and inotify_fd in rfds:
+                names, watch_lost, overflowed = _read_inotify_names(inotify_fd)
+                check_signal = check_signal or overflowed or signal_file.name in names
+                if watch_lost:
+                    # Directory went away or moved - fall back to polling
+                    sel.unregister(inotify_fd)
+                    os.close(inotify_fd)
+                    inotify_fd = None
+                    check_signal = True
+
+            # Handle output from child - forward everything pending
             if master_fd in rfds:
                 try:
-                    data = os.read(master_fd, 1024)
-                    if not data:
-                        break  # Child closed PTY
-                    os.write(sys.stdout.fileno(), data)
+                    if splice_output:
+                        try:
+                            child_closed = _splice_pending(master_fd, stdout_fd)
+                        except OSError as e:
+                            if e.errno != errno.EINVAL:
+                                raise
+                            # Kernel can't splice from a pty - copy instead
+                            splice_output = False
+                            child_closed = _copy_pending(master_fd, stdout_fd)
+                    else:
+                        child_closed = _copy_pending(master_fd, stdout_fd)
                 except OSError:
+                    break  # Output closed
+                if child_closed:
                     break
 
             # Handle input from user
-            if stdin_fd in rfds:
+            if stdin_from_file or stdin_fd in rfds:
                 try:
-                    data = os.read(stdin_fd, 1024)
+                    data = os.read(stdin_fd, PTY_CHUNK)
                     if data:
-                        os.write(master_fd, data)
+                        _write_all(master_fd, data)
+                    elif stdin_from_file:
+                        stdin_from_file = False
+                    else:
+                        # EOF on piped stdin - stop waking up for it
+                        sel.unregister(stdin_fd)
                 except OSError:
                     break
 
@@ -115,33 +327,49 @@ def _pty_spawn_with_signal(
                 pass
 
         # Clean up
+        sel.close()
         try:
             os.close(master_fd)
         except OSError:
             pass
+        if inotify_fd is not None:
+            os.close(inotify_fd)
 
     # Wait for child to exit
     _, status = os.waitpid(pid, 0)
     return status, was_signaled
 
 
-def _update_lock_starting_status(project_path: Path, story_id: str, status: str) -> None:
+def _update_lock_starting_status(
+    project_path: Path, story_id: str, status: str, lock_data: dict | None = None
+) -> dict | None:
     """
     Update the starting_status in the lock file for Stop hook detection.
 
     The Stop hook compares current status against starting_status to detect
     phase completion. This must be called at the start of each phase.
+
+    Pass the lock data returned by the previous call to skip re-reading
+    the file; nothing is written if starting_status is already status.
+    Returns the lock data, or None if there is no usable lock file.
     """
     lock_file = project_path / ".claude" / ".bmad-running" / f"{story_id}.json"
-    if not lock_file.exists():
-        return
 
     try:
-        lock_data = json.loads(lock_file.read_text())
+        if lock_data is None:
+            lock_data = json.loads(lock_file.read_bytes())
+        elif lock_data.get("starting_status") == status:
+            return lock_data
         lock_data["starting_status"] = status
-        lock_file.write_text(json.dumps(lock_data, indent=2) + "\n")
+        # must_exist - a lock removed meanwhile must not be brought back
+        atomic_write_bytes(
+            lock_file,
+            (json.dumps(lock_data, separators=(",", ":")) + "\n").encode(),
+            must_exist=True,
+        )
     except (json.JSONDecodeError, OSError):
-        pass  # Lock file corrupted or inaccessible
+        return None  # Lock file missing, corrupted or inaccessible
+    return lock_data
 
 
 @dataclass
@@ -173,6 +401,8 @@ class EpicResult:
     stories_completed: list[str] = field(default_factory=list)
     stories_failed: list[str] = field(default_factory=list)
     stories_skipped: list[str] = field(default_factory=list)
+    # IDs of the stories in stories_failed (those entries may carry a reason)
+    failed_ids: list[str] = field(default_factory=list)
 
 
 # Mapping from action types to BMAD skills
@@ -192,6 +422,9 @@ def update_story_status(
     Update a story's status in sprint-status.yaml.
 
     Uses simple text manipulation to avoid YAML library dependency.
+    The file is left untouched if the story has no entry. Otherwise it is
+    replaced atomically, so readers (and a crash mid-write) never see a
+    partially written file.
     """
     project_path = Path(project_path)
     yaml_path = find_sprint_status_file(project_path)
@@ -200,20 +433,16 @@ def update_story_status(
         raise FileNotFoundError(f"sprint-status.yaml not found in {project_path}")
 
     content = yaml_path.read_text()
-    lines = content.split("\n")
-    updated_lines = []
-
-    for line in lines:
-        # Match lines like "  1-1-project-setup: backlog"
-        stripped = line.strip()
-        if stripped.startswith(f"{story_id}:"):
-            # Preserve indentation
-            indent = line[: len(line) - len(line.lstrip())]
-            updated_lines.append(f"{indent}{story_id}: {new_status}")
-        else:
-            updated_lines.append(line)
 
-    yaml_path.write_text("\n".join(updated_lines))
+    # Match lines like "  1-1-project-setup: backlog", preserving indentation
+    pattern = re.compile(rf"^([ \t]*){re.escape(story_id)}:[^\n]*", re.MULTILINE)
+    replacement = f"{story_id}: {new_status}"
+    content, count = pattern.subn(lambda m: m.group(1) + replacement, content)
+
+    if not count:
+        return
+
+    atomic_write_bytes(yaml_path, content.encode())
 
 
 def build_local_command(action: Action, yolo: bool = False) -> list[str]:
@@ -236,6 +465,23 @@ def build_local_command(action: Action, yolo: bool = False) -> list[str]:
     return ["claude", prompt]
 
 
+def _exit_code_from_wait_status(exit_status: int, was_signaled: bool) -> int:
+    """
+    Turn a waitpid status into a shell-style exit code.
+
+    If we terminated Claude because the phase completed, that is success
+    however it exited (killed by our SIGTERM, or exiting after handling it).
+    Death by signal N is 128 + N.
+    """
+    if was_signaled:
+        return 0
+    try:
+        code = os.waitstatus_to_exitcode(exit_status)
+    except ValueError:
+        return 1  # Not an exit or a signal death (e.g. stopped)
+    return code if code >= 0 else 128 - code
+
+
 def dispatch_to_instance(
     action: Action,
     project_path: str | Path = ".",
@@ -290,18 +536,7 @@ def dispatch_to_instance(
         exit_status, was_signaled = _pty_spawn_with_signal(cmd, project_path)
         duration = time.time() - start_time
 
-        # Extract exit code from waitpid status
-        if os.WIFEXITED(exit_status):
-            exit_code = os.WEXITSTATUS(exit_status)
-        elif os.WIFSIGNALED(exit_status):
-            # Process was killed by signal (including our SIGTERM on phase complete)
-            if was_signaled:
-                # We terminated Claude because phase completed - this is success
-                exit_code = 0
-            else:
-                exit_code = 128 + os.WTERMSIG(exit_status)
-        else:
-            exit_code = 1
+        exit_code = _exit_code_from_wait_status(exit_status, was_signaled)
 
         return ExecutionResult(
             status="success" if exit_code == 0 else "failed",
@@ -359,6 +594,7 @@ def run_story_to_completion(
 
     previous_status: str | None = None
     same_status_count = 0
+    lock_data: dict | None = None
 
     for phase_num in range(max_phases):
         # Load current state
@@ -426,7 +662,7 @@ def run_story_to_completion(
         previous_status = current_status
 
         # Update lock file with current status so Stop hook can detect phase completion
-        _update_lock_starting_status(project_path, story_id, current_status)
+        lock_data = _update_lock_starting_status(project_path, story_id, current_status, lock_data)
 
         # Execute the action
         result = dispatch_to_instance(
@@ -498,9 +734,7 @@ def run_epic_to_completion(
 
     # Find stories belonging to this epic
     epic_num = epic_id.replace("epic-", "")
-    epic_stories = [
-        sid for sid in sorted(status.stories.keys()) if sid.startswith(f"{epic_num}-")
-    ]
+    epic_stories = status.epic_index.get(epic_num, [])
 
     if not epic_stories:
         return EpicResult(
@@ -511,6 +745,7 @@ def run_epic_to_completion(
     stories_completed: list[str] = []
     stories_failed: list[str] = []
     stories_skipped: list[str] = []
+    failed_ids: list[str] = []
 
     for story_id in epic_stories:
         # Skip already completed stories
@@ -529,11 +764,13 @@ def run_epic_to_completion(
             stories_completed.append(story_id)
         elif result.intervention_reason:
             stories_failed.append(f"{story_id}: {result.intervention_reason}")
+            failed_ids.append(story_id)
             # For now, stop on first failure
             # Future: could prompt user for skip/retry/abort
             break
         else:
             stories_failed.append(story_id)
+            failed_ids.append(story_id)
             break
 
     return EpicResult(
@@ -541,4 +778,5 @@ def run_epic_to_completion(
         stories_completed=stories_completed,
         stories_failed=stories_failed,
         stories_skipped=stories_skipped,
+        failed_ids=failed_ids,
     )
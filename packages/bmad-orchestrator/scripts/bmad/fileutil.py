@@ -0,0 +1,100 @@
+"""
+File helpers for BMAD orchestrator state files.
+
+Uses only Python stdlib (no external dependencies).
+"""
+
+import errno
+import os
+import stat
+import sys
+import tempfile
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+# renameat2() arguments (from <fcntl.h> and <linux/fs.h>)
+_AT_FDCWD = -100
+_RENAME_EXCHANGE = 2
+
+
+@cache
+def _renameat2() -> Any:
+    """Return libc's renameat2, or None where it isn't available."""
+    if sys.platform != "linux":
+        return None
+
+    import ctypes
+
+    try:
+        return ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):
+        return None
+
+
+def _exchange(src: str, dst: Path) -> bool:
+    """
+    Atomically swap two existing paths with renameat2(RENAME_EXCHANGE).
+
+    Returns False if the platform or filesystem can't do it. Raises
+    FileNotFoundError if dst doesn't exist.
+    """
+    renameat2 = _renameat2()
+    if renameat2 is None:
+        return False
+
+    import ctypes
+
+    if renameat2(_AT_FDCWD, os.fsencode(src), _AT_FDCWD, os.fsencode(dst), _RENAME_EXCHANGE) == 0:
+        return True
+    err = ctypes.get_errno()
+    if err in (errno.EINVAL, errno.ENOSYS):
+        return False
+    raise OSError(err, os.strerror(err), os.fspath(dst))
+
+
+def atomic_write_bytes(path: Path, data: bytes, must_exist: bool = False) -> os.stat_result:
+    """
+    Replace a file's contents atomically.
+
+    Writes to a temporary file in the same directory, fsyncs it and
+    renames it over path, so readers (and a crash mid-write) never see a
+    partially written file. The file keeps its existing permissions (new
+    files get the umask default). The temporary file is removed if any
+    step fails.
+
+    With must_exist, raises FileNotFoundError rather than creating path
+    if it doesn't exist or is removed while writing (race-free on Linux).
+    Returns the stat of the written file.
+    """
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        if must_exist:
+            raise
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with open(fd, "wb") as tmp:
+            tmp.write(data)
+            tmp.flush()
+            # Temp files are created 0600; the host may read these as another uid
+            os.fchmod(fd, mode)
+            os.fsync(fd)
+            st = os.fstat(fd)
+        if must_exist and _exchange(tmp_path, path):
+            os.unlink(tmp_path)  # Now holds the old contents
+        else:
+            if must_exist:
+                os.stat(path)
+            os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return st
@@ -5,8 +5,11 @@ Reads sprint-status.yaml directly and computes next action using BMAD's priority
 Uses only Python stdlib (no external dependencies).
 """
 
+import os
 import re
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -21,6 +24,13 @@ class SprintStatus:
     epic_counts: dict[str, int]  # {"backlog": 1, "in-progress": 1, ...}
     project: str  # Project name
     generated: str  # Generation date
+    # Sorted story IDs by epic number: {"1": ["1-1-project-setup", ...], ...}
+    epic_index: dict[str, list[str]] = field(default_factory=dict)
+    # (story_id, status) pairs sorted by story ID, computed from stories
+    sorted_stories: tuple[tuple[str, str], ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.sorted_stories = tuple(sorted(self.stories.items()))
 
 
 @dataclass
@@ -59,36 +69,33 @@ def parse_simple_yaml(content: str) -> dict[str, Any]:
     current_dict: dict[str, str] = {}
 
     for line in content.split("\n"):
-        # Skip empty lines and comments
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
+        # Only "key: value" lines matter - blank lines have no colon, and a
+        # comment's "key" starts with "#"
+        key, sep, value = line.partition(":")
+        if not sep:
             continue
-
-        # Check indentation
-        indent = len(line) - len(line.lstrip())
-
-        # Parse key: value
-        if ":" in stripped:
-            key, _, value = stripped.partition(":")
-            key = key.strip()
-            value = value.strip().strip('"').strip("'")
-
-            if indent == 0:
-                # Top-level key
-                if current_section and current_dict:
-                    result[current_section] = current_dict
-                    current_dict = {}
-
-                if value:
-                    result[key] = value
-                    current_section = None
-                else:
-                    # Start of a section
-                    current_section = key
-                    current_dict = {}
-            elif current_section:
-                # Nested key under current section
-                current_dict[key] = value
+        key = key.strip()
+        if key.startswith("#"):
+            continue
+        value = value.strip().strip('"').strip("'")
+
+        # Indented lines start with whitespace
+        if not line[0].isspace():
+            # Top-level key
+            if current_section and current_dict:
+                result[current_section] = current_dict
+                current_dict = {}
+
+            if value:
+                result[key] = value
+                current_section = None
+            else:
+                # Start of a section
+                current_section = key
+                current_dict = {}
+        elif current_section:
+            # Nested key under current section
+            current_dict[key] = value
 
     # Don't forget the last section
     if current_section and current_dict:
@@ -105,20 +112,21 @@ def find_sprint_status_file(project_path: str | Path) -> Path | None:
     - _bmad-output/implementation-artifacts/sprint-status.yaml
     - docs/sprint-status.yaml
     """
-    project_path = Path(project_path)
-
-    locations = [
-        project_path / "_bmad-output" / "implementation-artifacts" / "sprint-status.yaml",
-        project_path / "docs" / "sprint-status.yaml",
-    ]
-
-    for loc in locations:
+    for loc in _sprint_status_locations(Path(project_path)):
         if loc.exists():
             return loc
 
     return None
 
 
+def _sprint_status_locations(project_path: Path) -> list[Path]:
+    """Candidate sprint-status.yaml paths, in lookup order."""
+    return [
+        project_path / "_bmad-output" / "implementation-artifacts" / "sprint-status.yaml",
+        project_path / "docs" / "sprint-status.yaml",
+    ]
+
+
 def load_sprint_status(project_path: str | Path) -> SprintStatus:
     """
     Read and parse sprint-status.yaml directly.
@@ -128,19 +136,35 @@ def load_sprint_status(project_path: str | Path) -> SprintStatus:
           epic-1: in-progress
           1-1-project-setup: review
 
+    Parsed results are cached by file mtime and size, so repeated calls
+    (e.g. menu refreshes) only stat the file while it is unchanged.
+    The returned SprintStatus is shared and must not be mutated.
+
     Raises:
         FileNotFoundError: If sprint-status.yaml not found
         ValueError: If file format is invalid
     """
     project_path = Path(project_path)
-    yaml_path = find_sprint_status_file(project_path)
 
-    if yaml_path is None:
-        raise FileNotFoundError(
-            f"sprint-status.yaml not found in {project_path}. "
-            "Run /bmad:bmm:workflows:sprint-planning to create it."
-        )
+    # One stat per candidate both finds the file and keys the cache
+    for yaml_path in _sprint_status_locations(project_path):
+        try:
+            st = os.stat(yaml_path)
+        except OSError:
+            continue
+        return _load_sprint_status_cached(yaml_path, st.st_mtime_ns, st.st_size)
+
+    raise FileNotFoundError(
+        f"sprint-status.yaml not found in {project_path}. "
+        "Run /bmad:bmm:workflows:sprint-planning to create it."
+    )
+
 
+@lru_cache(maxsize=8)
+def _load_sprint_status_cached(
+    yaml_path: Path, mtime_ns: int, size: int
+) -> SprintStatus:
+    """Parse sprint-status.yaml; mtime_ns and size only key the cache."""
     with open(yaml_path) as f:
         content = f.read()
 
@@ -167,17 +191,20 @@ def load_sprint_status(project_path: str | Path) -> SprintStatus:
         else:
             stories[key] = value
 
-    # Count story statuses
-    counts = {status: 0 for status in STORY_STATUSES}
-    for status in stories.values():
-        if status in counts:
-            counts[status] += 1
-
-    # Count epic statuses
-    epic_counts = {status: 0 for status in EPIC_STATUSES}
-    for status in epics.values():
-        if status in epic_counts:
-            epic_counts[status] += 1
+    # Index stories by epic number ("1-2-user-registration" → "1")
+    epic_index: dict[str, list[str]] = {}
+    for story_id in stories:
+        epic_num, sep, _ = story_id.partition("-")
+        if sep:
+            epic_index.setdefault(epic_num, []).append(story_id)
+    for story_ids in epic_index.values():
+        story_ids.sort()
+
+    # Count story and epic statuses (unknown statuses are ignored)
+    story_tally = Counter(stories.values())
+    counts = {status: story_tally[status] for status in STORY_STATUSES}
+    epic_tally = Counter(epics.values())
+    epic_counts = {status: epic_tally[status] for status in EPIC_STATUSES}
 
     return SprintStatus(
         epics=epics,
@@ -186,9 +213,22 @@ def load_sprint_status(project_path: str | Path) -> SprintStatus:
         epic_counts=epic_counts,
         project=data.get("project", "Unknown"),
         generated=data.get("generated", "Unknown"),
+        epic_index=epic_index,
     )
 
 
+# Story statuses that have a next action, by priority (0 = highest)
+NEXT_ACTION_PRIORITY = {"in-progress": 0, "review": 1, "ready-for-dev": 2, "backlog": 3}
+
+# (action type, skill) for each priority
+NEXT_ACTIONS = [
+    ("dev-story", "bmad:bmm:workflows:dev-story"),
+    ("code-review", "bmad:bmm:workflows:code-review"),
+    ("dev-story", "bmad:bmm:workflows:dev-story"),
+    ("create-story", "bmad:bmm:workflows:create-story"),
+]
+
+
 def get_next_action(
     status: SprintStatus, skip_stories: set[str] | None = None
 ) -> Action | None:
@@ -208,46 +248,32 @@ def get_next_action(
     """
     skip = skip_stories or set()
 
-    # Sort stories by ID for consistent ordering
-    sorted_stories = sorted(status.stories.items(), key=lambda x: x[0])
-
-    # Priority 1: Continue in-progress stories
-    for story_id, story_status in sorted_stories:
-        if story_id in skip:
+    # One pass in story ID order, keeping the first story of the best
+    # priority seen so far; nothing beats in-progress, so stop there
+    best_rank = len(NEXT_ACTION_PRIORITY)
+    best_id: str | None = None
+    for story_id, story_status in status.sorted_stories:
+        rank = NEXT_ACTION_PRIORITY.get(story_status)
+        if rank is None or rank >= best_rank or story_id in skip:
             continue
-        if story_status == "in-progress":
-            return Action("dev-story", story_id, "bmad:bmm:workflows:dev-story")
-
-    # Priority 2: Review completed stories
-    for story_id, story_status in sorted_stories:
-        if story_id in skip:
-            continue
-        if story_status == "review":
-            return Action("code-review", story_id, "bmad:bmm:workflows:code-review")
-
-    # Priority 3: Start ready-for-dev stories
-    for story_id, story_status in sorted_stories:
-        if story_id in skip:
-            continue
-        if story_status == "ready-for-dev":
-            return Action("dev-story", story_id, "bmad:bmm:workflows:dev-story")
-
-    # Priority 4: Create stories from backlog
-    for story_id, story_status in sorted_stories:
-        if story_id in skip:
-            continue
-        if story_status == "backlog":
-            return Action("create-story", story_id, "bmad:bmm:workflows:create-story")
+        best_rank = rank
+        best_id = story_id
+        if rank == 0:
+            break
 
     # All complete
-    return None
+    if best_id is None:
+        return None
+
+    action_type, skill = NEXT_ACTIONS[best_rank]
+    return Action(action_type, best_id, skill)
 
 
 def get_stories_by_status(status: SprintStatus) -> dict[str, list[str]]:
     """Group stories by their status for display."""
     by_status: dict[str, list[str]] = {s: [] for s in STORY_STATUSES}
 
-    for story_id, story_status in sorted(status.stories.items()):
+    for story_id, story_status in status.sorted_stories:
         if story_status in by_status:
             by_status[story_status].append(story_id)
 
@@ -260,7 +286,6 @@ def get_epic_for_story(story_id: str) -> str:
 
     Example: "1-2-user-registration" → "epic-1"
     """
-    parts = story_id.split("-")
-    if parts and parts[0].isdigit():
-        return f"epic-{parts[0]}"
-    return "unknown"
+    end = story_id.find("-")
+    prefix = story_id if end < 0 else story_id[:end]
+    return f"epic-{prefix}" if prefix.isdigit() else "unknown"